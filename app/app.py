@@ -5,7 +5,7 @@ from typing import Sequence
 
 from PyQt6.QtWidgets import QApplication
 
-from .ui.main_window import MainWindow
+from .ui.main_window import APP_QSS, MainWindow
 
 
 def create_app(args: Sequence[str] | None = None) -> QApplication:
@@ -14,6 +14,7 @@ def create_app(args: Sequence[str] | None = None) -> QApplication:
     app = QApplication(argv)
     app.setOrganizationName("RobotCut")
     app.setApplicationName("Robot Cutter HMI")
+    app.setStyleSheet(APP_QSS)
     return app
 
 
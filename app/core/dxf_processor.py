@@ -3,16 +3,58 @@
 # Harold & Abril · versión final estable
 # =============================================================
 
-import ezdxf
 import numpy as np
-import matplotlib.pyplot as plt
 from shapely.geometry import LineString, MultiLineString
 from shapely.ops import linemerge, unary_union
-from scipy.interpolate import splprep, splev
-from sklearn.cluster import DBSCAN
 from typing import List, Tuple, Optional
 import os
 
+# ezdxf, matplotlib, scipy y cuML se importan bajo demanda para no penalizar
+# el arranque de la HMI cuando no se procesa ningún DXF
+_MPL = None
+_GPU = None
+
+# A partir de cuántos endpoints compensa agrupar en GPU (si hay cuML)
+GPU_MIN_ENDPOINTS = 50_000
+
+
+def _mpl():
+    """Retorna matplotlib.pyplot, importándolo una sola vez"""
+    global _MPL
+    if _MPL is None:
+        import matplotlib.pyplot as plt
+        _MPL = plt
+    return _MPL
+
+
+def _gpu_dbscan():
+    """Retorna (DBSCAN de cuML, cudf) o None si no están disponibles"""
+    global _GPU
+    if _GPU is None:
+        try:
+            from cuml.cluster import DBSCAN
+            import cudf
+            _GPU = (DBSCAN, cudf)
+        except Exception:
+            _GPU = False
+    return _GPU or None
+
+
+# Parámetro de muestreo compartido por todas las splines
+_U200 = np.linspace(0, 1, 200)
+
+# Separador entre trayectorias en merged_xy
+_NAN_ROW = np.full((1, 2), np.nan)
+
+
+def _sample_bspline(pts: np.ndarray) -> np.ndarray:
+    """Interpola una B-spline por los puntos dados y la muestrea en _U200"""
+    from scipy.interpolate import splprep, splev
+
+    tck, _ = splprep([pts[:, 0], pts[:, 1]], s=0, k=min(3, len(pts) - 1))
+    x, y = splev(_U200, tck)
+    return np.column_stack([x, y])
+
 
 class DXFProcessor:
     """Clase principal para procesar archivos DXF"""
@@ -21,18 +63,35 @@ class DXFProcessor:
         self.tolerance = tolerance
         self.geoms = []
         self.merged_geoms = []
+        # Coordenadas de merged_geoms en un solo arreglo (N, 2), NaN entre trayectorias
+        self.merged_xy = np.empty((0, 2))
         self.centroids = None
         
     def load_dxf(self, dxf_path: str) -> bool:
         """Carga y procesa un archivo DXF"""
         try:
+            import ezdxf
+
             doc = ezdxf.readfile(dxf_path)
             msp = doc.modelspace()
             self.geoms = []
-            
-            for entity in msp:
-                self._process_entity(entity)
-                
+
+            # 1. Clasificar entidades; círculos y arcos se acumulan como SoA
+            geoms = {}
+            circles, arcs = [], []
+            for idx, entity in enumerate(msp):
+                self._process_entity(idx, entity, geoms, circles, arcs)
+
+            # 2. Discretizar todos los círculos/arcos en una sola llamada
+            if circles or arcs:
+                desc = np.array(circles + arcs)
+                samples = self._arc_samples(desc[:, 3], desc[:, 5] - desc[:, 4])
+                pts = self._batch_arcs(desc[:, 1:3], desc[:, 3], desc[:, 4], desc[:, 5], samples)
+                geoms.update(zip(desc[:, 0].astype(int), [LineString(p) for p in pts]))
+
+            # Mantener el orden original de las entidades
+            self.geoms = [geoms[k] for k in sorted(geoms)]
+
             if not self.geoms:
                 raise ValueError("⚠️ No se detectaron entidades válidas en el DXF.")
                 
@@ -41,7 +100,7 @@ class DXFProcessor:
         except Exception as e:
             raise Exception(f"❌ Error cargando DXF: {str(e)}")
     
-    def _process_entity(self, entity) -> None:
+    def _process_entity(self, idx: int, entity, geoms: dict, circles: list, arcs: list) -> None:
         """Procesa una entidad individual del DXF"""
         dtype = entity.dxftype()
         puntos = []
@@ -61,86 +120,163 @@ class DXFProcessor:
 
             elif dtype == "CIRCLE":
                 c, r = entity.dxf.center, entity.dxf.radius
-                t = np.linspace(0, 2*np.pi, 200)
-                puntos = np.column_stack([c.x + r*np.cos(t), c.y + r*np.sin(t)])
+                circles.append((idx, c.x, c.y, r, 0.0, 2*np.pi))
 
             elif dtype == "ARC":
                 c, r = entity.dxf.center, entity.dxf.radius
                 a1, a2 = np.deg2rad(entity.dxf.start_angle), np.deg2rad(entity.dxf.end_angle)
-                t = np.linspace(a1, a2, 120)
-                puntos = np.column_stack([c.x + r*np.cos(t), c.y + r*np.sin(t)])
+                arcs.append((idx, c.x, c.y, r, a1, a2))
 
             elif dtype == "SPLINE":
                 puntos = self._process_spline(entity)
 
             if len(puntos) > 1:
-                self.geoms.append(LineString(puntos))
+                geoms[idx] = LineString(puntos)
 
         except Exception as ex:
             print(f"⚠️ No se pudo procesar {dtype}: {ex}")
+
+    def _arc_samples(self, radii: np.ndarray, sweeps: np.ndarray) -> np.ndarray:
+        """Número de muestras por arco para que el error de cuerda no supere
+        la mitad de la tolerancia (mínimo 16)"""
+        chord_tol = self.tolerance * 0.5
+        with np.errstate(divide='ignore', invalid='ignore'):
+            theta = 2*np.arccos(np.clip(1 - chord_tol/radii, -1, 1))
+            segments = np.ceil(np.abs(sweeps) / theta)
+        return np.maximum(16, np.nan_to_num(segments).astype(np.int64) + 1)
+
+    @staticmethod
+    def _batch_arcs(centers: np.ndarray, radii: np.ndarray, a1: np.ndarray,
+                    a2: np.ndarray, samples: np.ndarray) -> List[np.ndarray]:
+        """Discretiza N arcos a la vez con samples[i] puntos cada uno"""
+        offsets = np.cumsum(samples)
+        arc = np.repeat(np.arange(len(samples)), samples)
+        k = np.arange(offsets[-1]) - np.repeat(offsets - samples, samples)
+        t = a1[arc] + (a2 - a1)[arc] * (k / (samples[arc] - 1))
+        r = radii[arc]
+        pts = np.column_stack([centers[arc, 0] + r*np.cos(t),
+                               centers[arc, 1] + r*np.sin(t)])
+        return np.split(pts, offsets[:-1])
     
     def _process_spline(self, spline_entity) -> np.ndarray:
         """Procesa entidades SPLINE"""
-        fit = np.array(spline_entity.fit_points)
-        if len(fit) >= 2:
-            tck, _ = splprep([fit[:,0], fit[:,1]], s=0)
-            u = np.linspace(0, 1, 200)
-            x, y = splev(u, tck)
-            return np.column_stack([x, y])
-        else:
-            ctrl = np.array(spline_entity.control_points)
-            if len(ctrl) >= 2:
-                tck, _ = splprep([ctrl[:,0], ctrl[:,1]], s=0)
-                u = np.linspace(0, 1, 200)
-                x, y = splev(u, tck)
-                return np.column_stack([x, y])
-        return np.array([])
+        pts = np.array(spline_entity.fit_points)
+        if len(pts) < 2:
+            pts = np.array(spline_entity.control_points)
+        if len(pts) < 2:
+            return np.array([])
+        pts = pts[:, :2]
+        if len(pts) == 2:
+            return pts
+        # Splines casi rectas: basta con los extremos
+        chord = pts[-1] - pts[0]
+        length = np.hypot(*chord)
+        if length > 0:
+            rel = pts[1:-1] - pts[0]
+            dev = np.abs(chord[0]*rel[:, 1] - chord[1]*rel[:, 0]) / length
+            if dev.max() < self.tolerance:
+                return pts[[0, -1]]
+        return _sample_bspline(pts)
     
     def cluster_endpoints(self) -> None:
-        """Agrupa endpoints usando DBSCAN"""
+        """Agrupa endpoints que distan menos de la tolerancia"""
         if not self.geoms:
             raise ValueError("No hay geometrías para procesar")
             
-        endpoints = []
-        endpoint_map = []
-        
+        # Extremo inicial de la geometría gi en 2*gi, final en 2*gi + 1
+        n = len(self.geoms)
+        endpoints = np.empty((2*n, 2), dtype=np.float64)
+        coords = []
         for gi, g in enumerate(self.geoms):
-            coords = list(g.coords)
-            endpoints.append(coords[0])
-            endpoint_map.append((gi, 0))
-            endpoints.append(coords[-1])
-            endpoint_map.append((gi, -1))
-
-        endpoints = np.array(endpoints)
-        clustering = DBSCAN(eps=self.tolerance, min_samples=1, metric='euclidean')
-        labels = clustering.fit_predict(endpoints)
-        n_clusters = labels.max() + 1
+            c = np.asarray(g.coords)
+            coords.append(c)
+            endpoints[2*gi] = c[0]
+            endpoints[2*gi + 1] = c[-1]
+
+        # Los nodos compartidos (uniones en T, polilíneas encadenadas) repiten
+        # coordenadas: se agrupa sólo el conjunto único y se re-expande.
+        # Los representantes se toman en orden de aparición para conservar
+        # la numeración de las etiquetas.
+        _, first, inv = np.unique(endpoints, axis=0, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        labels_u = self._cluster_labels(endpoints[first[order]])
+        labels = labels_u[rank[inv.ravel()]]
         
         # Calcular centroides
-        self.centroids = np.zeros((n_clusters, 2))
-        for k in range(n_clusters):
-            pts = endpoints[labels == k]
-            self.centroids[k] = pts.mean(axis=0)
+        sums = np.zeros((labels.max() + 1, 2))
+        np.add.at(sums, labels, endpoints)
+        self.centroids = sums / np.bincount(labels)[:, None]
         
         # Reemplazar extremos por centroides
-        geoms_sanitized = []
-        for gi, g in enumerate(self.geoms):
-            coords = list(g.coords)
-            label_start = labels[2*gi]
-            label_end = labels[2*gi + 1]
-            new_coords = coords.copy()
-            new_coords[0] = tuple(self.centroids[label_start])
-            new_coords[-1] = tuple(self.centroids[label_end])
-            geoms_sanitized.append(LineString(new_coords))
+        snapped = self.centroids[labels]
+        for gi, c in enumerate(coords):
+            c[0] = snapped[2*gi]
+            c[-1] = snapped[2*gi + 1]
+        geoms_sanitized = [LineString(c) for c in coords]
             
         self.geoms = geoms_sanitized
     
+    def _cluster_labels(self, points: np.ndarray) -> np.ndarray:
+        """Etiquetas de grupo; en GPU (cuML) sólo para nubes muy grandes"""
+        gpu = _gpu_dbscan() if len(points) > GPU_MIN_ENDPOINTS else None
+        if gpu is not None:
+            DBSCAN, cudf = gpu
+            try:
+                model = DBSCAN(eps=self.tolerance, min_samples=1)
+                labels = model.fit(cudf.DataFrame(points)).labels_.to_numpy()
+                # Renumerar en orden de aparición, como _grid_labels
+                _, first, inv = np.unique(labels, return_index=True, return_inverse=True)
+                return np.argsort(np.argsort(first))[inv]
+            except Exception as ex:
+                print(f"⚠️ cuML no disponible, se agrupa en CPU: {ex}")
+        return self._grid_labels(points, self.tolerance)
+
+    @staticmethod
+    def _grid_labels(points: np.ndarray, eps: float) -> np.ndarray:
+        """Componentes conexas a distancia <= eps (equivale a DBSCAN con
+        min_samples=1) usando una rejilla de celdas de lado eps y union-find"""
+        n = len(points)
+        parent = list(range(n))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        cells = {}
+        for i, key in enumerate(map(tuple, np.floor(points / eps).astype(np.int64).tolist())):
+            cells.setdefault(key, []).append(i)
+
+        # Basta con la mitad de los vecinos: cada par de celdas se visita una vez
+        eps2 = eps * eps
+        for (cx, cy), idx in cells.items():
+            a = points[idx]
+            for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+                other = cells.get((cx + dx, cy + dy))
+                if other is None:
+                    continue
+                d2 = ((a[:, None, :] - points[other][None, :, :]) ** 2).sum(axis=-1)
+                for i, j in np.argwhere(d2 <= eps2):
+                    ri, rj = find(idx[i]), find(other[j])
+                    if ri != rj:
+                        parent[max(ri, rj)] = min(ri, rj)
+
+        # La raíz es el menor índice del grupo: etiquetas en orden de aparición
+        roots = np.array([find(i) for i in range(n)])
+        return np.unique(roots, return_inverse=True)[1]
+
     def merge_geometries(self) -> None:
         """Une líneas conectadas"""
         if not self.geoms:
             raise ValueError("No hay geometrías para fusionar")
             
-        union = unary_union(self.geoms)
+        # Unión en cascada por bloques: GEOS escala mal con listas planas grandes
+        chunk = 200
+        parts = [unary_union(self.geoms[i:i+chunk]) for i in range(0, len(self.geoms), chunk)]
+        union = unary_union(parts)
         merged = linemerge(union)
 
         if isinstance(merged, LineString):
@@ -149,6 +285,12 @@ class DXFProcessor:
             self.merged_geoms = list(merged.geoms)
         else:
             self.merged_geoms = []
+
+        parts = []
+        for g in self.merged_geoms:
+            parts.append(np.asarray(g.coords)[:, :2])
+            parts.append(_NAN_ROW)
+        self.merged_xy = np.vstack(parts) if parts else np.empty((0, 2))
     
     def process_file(self, dxf_path: str) -> bool:
         """Procesa completo del archivo DXF"""
@@ -176,17 +318,22 @@ class DXFProcessor:
             'tolerance_used': self.tolerance
         }
     
+    def _trajectory_slices(self) -> List[slice]:
+        """Tramos de merged_xy de cada trayectoria (sin la fila NaN final)"""
+        ends = np.flatnonzero(np.isnan(self.merged_xy[:, 0]))
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        return [slice(a, b) for a, b in zip(starts, ends)]
+    
     def export_to_txt(self, output_path: str) -> str:
         """Exporta las trayectorias a archivo TXT"""
         if not self.merged_geoms:
             raise ValueError("No hay trayectorias para exportar")
             
-        with open(output_path, 'w') as f:
+        # Escritura en streaming por trayectoria: nunca se arma el archivo en memoria
+        with open(output_path, 'w', buffering=1 << 20) as f:
             f.write("X Y\n")
-            for geom in self.merged_geoms:
-                x, y = geom.xy
-                for xi, yi in zip(x, y):
-                    f.write(f"{xi:.6f} {yi:.6f}\n")
+            for sl in self._trajectory_slices():
+                np.savetxt(f, self.merged_xy[sl], fmt="%.6f %.6f")
                 f.write("NaN NaN\n")
         
         return output_path
@@ -195,11 +342,12 @@ class DXFProcessor:
         """Genera gráfico de las trayectorias resultantes"""
         if not self.merged_geoms:
             raise ValueError("No hay trayectorias para graficar")
-            
+
+        plt = _mpl()
         plt.figure(figsize=(8, 8))
-        for i, geom in enumerate(self.merged_geoms):
-            x, y = geom.xy
-            plt.plot(x, y, linewidth=1.2, label=f"Trayectoria {i+1}")
+        for i, sl in enumerate(self._trajectory_slices()):
+            xy = self.merged_xy[sl]
+            plt.plot(xy[:, 0], xy[:, 1], linewidth=1.2, label=f"Trayectoria {i+1}")
         
         plt.axis('equal')
         plt.title("🧩 Figura reconstruida (DBSCAN robusto)")
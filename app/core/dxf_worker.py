@@ -0,0 +1,48 @@
+# =============================================================
+# 🧵 Procesamiento DXF en segundo plano (QThreadPool)
+# =============================================================
+
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from .dxf_processor import DXFProcessor
+
+
+class DXFWorkerSignals(QObject):
+    """Señales del worker (QRunnable no hereda de QObject)"""
+    finished = pyqtSignal(object, object)   # DXFProcessor ya procesado, resultado de postprocess
+    failed = pyqtSignal(str)
+
+
+class DXFWorker(QRunnable):
+    """Ejecuta DXFProcessor.process_file fuera del hilo de la GUI.
+
+    Cada worker usa su propio DXFProcessor, así varios archivos pueden
+    procesarse a la vez sin compartir estado. Shapely 2 libera el GIL
+    dentro de GEOS, por lo que el trabajo pesado corre en paralelo.
+    `postprocess` (opcional) también corre en el worker y no debe crear
+    objetos Qt; su resultado se emite junto al procesador.
+    """
+
+    def __init__(self, dxf_path: str, tolerance: float = 0.05,
+                 postprocess: Optional[Callable[[DXFProcessor], Any]] = None):
+        super().__init__()
+        self.dxf_path = dxf_path
+        self.processor = DXFProcessor(tolerance)
+        self.postprocess = postprocess
+        self.signals = DXFWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            if self.processor.process_file(self.dxf_path):
+                result = self.postprocess(self.processor) if self.postprocess else None
+                self.signals.finished.emit(self.processor, result)
+            else:
+                self.signals.failed.emit("No se encontraron entidades válidas")
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+    def start(self) -> None:
+        """Encola el worker en el pool global"""
+        QThreadPool.globalInstance().start(self)
@@ -0,0 +1,43 @@
+# =============================================================
+# ↔️ Transformación afín de coordenadas (escala, rotación, traslación)
+# =============================================================
+
+import numpy as np
+
+# Numba es opcional: sin él todo pasa por NumPy
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Por debajo de este número de puntos NumPy ya es suficiente
+NUMBA_MIN_POINTS = 50_000
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _affine_kernel(src, dst, a, b, c, d, tx, ty):
+        for i in prange(src.shape[0]):
+            x = src[i, 0]
+            y = src[i, 1]
+            dst[i, 0] = a*x + b*y + tx
+            dst[i, 1] = c*x + d*y + ty
+
+
+def affine_xy(src: np.ndarray, dst: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """Escribe en dst la afín M (2x3) aplicada a src (N, 2)"""
+    if HAS_NUMBA and len(src) >= NUMBA_MIN_POINTS:
+        (a, b, tx), (c, d, ty) = M
+        _affine_kernel(src, dst, a, b, c, d, tx, ty)
+    else:
+        np.matmul(src, M[:, :2].T.astype(src.dtype), out=dst)
+        dst += M[:, 2].astype(src.dtype)
+    return dst
+
+
+def warmup() -> None:
+    """Compila el kernel de Numba para que el primer arrastre no pague el JIT"""
+    if HAS_NUMBA:
+        src = np.zeros((1, 2), dtype=np.float32)
+        _affine_kernel(src, np.empty_like(src), 1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
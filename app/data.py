@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ShapeParameter:
     key: str
     label: str
@@ -13,14 +14,20 @@ class ShapeParameter:
     maximum: float = 1000.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CutShape:
     name: str
     kind: str
-    parameters: List[ShapeParameter] = field(default_factory=list)
+    parameters: Tuple[ShapeParameter, ...] = ()
+    # {key: value} built once per instance; frozen, so it never goes stale.
+    state: Mapping[str, float] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        state = {param.key: param.value for param in self.parameters}
+        object.__setattr__(self, "state", MappingProxyType(state))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CutProgram:
     title: str
-    shapes: List[CutShape] = field(default_factory=list)
+    shapes: Tuple[CutShape, ...] = ()
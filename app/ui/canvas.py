@@ -2,14 +2,51 @@ from __future__ import annotations
 
 import math
 
-from PyQt6.QtCore import QPointF, QRectF, Qt
-from PyQt6.QtGui import QColor, QLinearGradient, QPainter, QPen, QFont
-from PyQt6.QtWidgets import QFrame, QGraphicsItemGroup, QGraphicsScene, QGraphicsView
+from PyQt6.QtCore import QLineF, QPointF, QRectF, Qt
+from PyQt6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QLinearGradient,
+    QOpenGLContext,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QStaticText,
+    QTransform,
+)
+from PyQt6.QtWidgets import (
+    QFrame,
+    QGraphicsItemGroup,
+    QGraphicsScene,
+    QGraphicsView,
+)
+
+# The OpenGL viewport is optional: without QtOpenGLWidgets (or a usable GL
+# context) the view keeps the raster viewport.
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+
+_QSS = """
+QGraphicsView {
+    border: 1px solid #262626;
+    border-radius: 12px;
+    background-color: transparent;
+}
+"""
 
 
 class CanvasScene(QGraphicsScene):
     """Scene that renders a machining bed grid and sample geometry."""
 
+    MAX_TILE_PX = 2048
+    LABEL_MIN_SPACING = 40.0
+    MAX_CACHED_LABELS = 1024
+
     def __init__(self, width: float = 900, height: float = 620, grid: float = 25.0) -> None:
         half_w = width / 2
         half_h = height / 2
@@ -20,87 +57,168 @@ class CanvasScene(QGraphicsScene):
         self.setBackgroundBrush(QColor("#090909"))
         self.shape_group: QGraphicsItemGroup | None = None
         self._shape_origin = QPointF()
+        self._tile_cache: dict[float, QPixmap] = {}
+        self._label_cache: dict[int, QStaticText] = {}
+        self._init_paint_resources()
         self._add_sample_geometry()
 
+    def _init_paint_resources(self) -> None:
+        """Create the pens, font and gradient reused by every background paint."""
+        self._grid_gradient = QLinearGradient(0, 0, 0, 1)
+        self._grid_gradient.setColorAt(0.0, QColor(20, 20, 20))
+        self._grid_gradient.setColorAt(0.5, QColor(12, 12, 12))
+        self._grid_gradient.setColorAt(1.0, QColor(6, 6, 6))
+        self._minor_pen = QPen(QColor(45, 45, 45))
+        self._minor_pen.setWidth(1)
+        self._major_pen = QPen(QColor(70, 70, 70))
+        self._major_pen.setWidth(2)
+        self._x_axis_pen = QPen(QColor("#17a589"))
+        self._x_axis_pen.setWidth(2)
+        self._y_axis_pen = QPen(QColor("#c0392b"))
+        self._y_axis_pen.setWidth(2)
+        self._origin_brush = QBrush(QColor("#f4d03f"))
+        self._label_font = QFont()
+        self._label_font.setPointSize(8)
+        self._label_color = QColor("#8c9399")
+
     def drawBackground(self, painter: QPainter, rect: QRectF) -> None:  # noqa: N802
         """Draw grid lines for the canvas."""
         super().drawBackground(painter, rect)
 
         painter.save()
-        gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
-        gradient.setColorAt(0.0, QColor(20, 20, 20))
-        gradient.setColorAt(0.5, QColor(12, 12, 12))
-        gradient.setColorAt(1.0, QColor(6, 6, 6))
-        painter.fillRect(rect, gradient)
-        painter.restore()
-
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
-        minor_pen = QPen(QColor(45, 45, 45))
-        minor_pen.setWidth(1)
-        major_pen = QPen(QColor(70, 70, 70))
-        major_pen.setWidth(2)
+        self._grid_gradient.setStart(rect.topLeft())
+        self._grid_gradient.setFinalStop(rect.bottomLeft())
+        painter.fillRect(rect, self._grid_gradient)
 
         v_start = int(math.floor(rect.left() / self.grid))
         v_end = int(math.ceil(rect.right() / self.grid))
-        for i in range(v_start, v_end + 1):
-            x = i * self.grid
-            painter.setPen(major_pen if i % self.major_step == 0 else minor_pen)
-            painter.drawLine(x, rect.top(), x, rect.bottom())
-
         h_start = int(math.floor(rect.top() / self.grid))
         h_end = int(math.ceil(rect.bottom() / self.grid))
-        for j in range(h_start, h_end + 1):
-            y = j * self.grid
-            painter.setPen(major_pen if j % self.major_step == 0 else minor_pen)
-            painter.drawLine(rect.left(), y, rect.right(), y)
-        painter.restore()
 
-        painter.save()
-        axis_pen = QPen(QColor("#17a589"))
-        axis_pen.setWidth(2)
-        painter.setPen(axis_pen)
-        painter.drawLine(rect.left(), 0, rect.right(), 0)  # X axis
-        axis_pen.setColor(QColor("#c0392b"))
-        painter.setPen(axis_pen)
-        painter.drawLine(0, rect.top(), 0, rect.bottom())  # Y axis
-        painter.setBrush(QColor("#f4d03f"))
+        zoom = painter.worldTransform().m11()
+        tile = self._grid_tile(zoom)
+        if tile is None:
+            self._draw_grid_lines(painter, rect, v_start, v_end, h_start, h_end)
+        else:
+            # Tiles are aligned to multiples of the major grid in scene space
+            offset = QPointF(rect.left() % self.major_grid, rect.top() % self.major_grid)
+            painter.drawTiledPixmap(rect, tile, offset)
+
+        painter.setPen(self._x_axis_pen)
+        painter.drawLine(QLineF(rect.left(), 0, rect.right(), 0))  # X axis
+        painter.setPen(self._y_axis_pen)
+        painter.drawLine(QLineF(0, rect.top(), 0, rect.bottom()))  # Y axis
+        painter.setBrush(self._origin_brush)
         painter.drawEllipse(QPointF(0, 0), 4, 4)
+
+        painter.setFont(self._label_font)
+        painter.setPen(self._label_color)
+
+        # Labels are skipped when illegible and thinned out when crowded
+        label_stride = self._label_stride(zoom)
+        if label_stride:
+            label_step = self.major_step * label_stride
+            for i in range(v_start, v_end + 1):
+                if i == 0 or i % label_step != 0:
+                    continue
+                x = i * self.grid
+                label = self._label(int(x))
+                size = label.size()
+                painter.drawStaticText(QPointF(x - size.width() / 2, -10 - size.height() / 2), label)
+
+            for j in range(h_start, h_end + 1):
+                if j == 0 or j % label_step != 0:
+                    continue
+                y = j * self.grid
+                label = self._label(int(-y))
+                size = label.size()
+                painter.drawStaticText(QPointF(-6 - size.width(), y - size.height() / 2), label)
+
+        painter.drawText(
+            QRectF(rect.right() - 70, rect.top() + 8, 60, 16),
+            Qt.AlignmentFlag.AlignRight,
+            "units: mm",
+        )
         painter.restore()
 
+    def _label(self, value: int) -> QStaticText:
+        """Return a pre-shaped axis label, laid out once per value."""
+        label = self._label_cache.get(value)
+        if label is None:
+            if len(self._label_cache) >= self.MAX_CACHED_LABELS:
+                self._label_cache.clear()
+            label = QStaticText(str(value))
+            label.prepare(QTransform(), self._label_font)
+            self._label_cache[value] = label
+        return label
+
+    def _label_stride(self, zoom: float) -> int:
+        """Return every how many major lines to label (0 = no labels)."""
+        spacing = self.major_grid * zoom
+        if spacing < self.LABEL_MIN_SPACING:
+            return 0
+        return 1 if spacing >= 2 * self.LABEL_MIN_SPACING else 2
+
+    def _draw_grid_lines(
+        self, painter: QPainter, rect: QRectF, v_start: int, v_end: int, h_start: int, h_end: int
+    ) -> None:
+        """Vector fallback used when the zoom level is too extreme for a tile."""
         painter.save()
-        font = QFont()
-        font.setPointSize(8)
-        painter.setFont(font)
-        painter.setPen(QColor("#8c9399"))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
 
+        # Collect lines first so each pen is set once and drawn in one call
+        minor_lines: list[QLineF] = []
+        major_lines: list[QLineF] = []
         for i in range(v_start, v_end + 1):
-            if i == 0 or i % self.major_step != 0:
-                continue
             x = i * self.grid
-            painter.drawText(
-                QRectF(x - 30, -18, 60, 16),
-                Qt.AlignmentFlag.AlignCenter,
-                f"{int(x)}",
-            )
-
+            lines = major_lines if i % self.major_step == 0 else minor_lines
+            lines.append(QLineF(x, rect.top(), x, rect.bottom()))
         for j in range(h_start, h_end + 1):
-            if j == 0 or j % self.major_step != 0:
-                continue
             y = j * self.grid
-            painter.drawText(
-                QRectF(-54, y - 8, 48, 16),
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
-                f"{int(-y)}",
-            )
+            lines = major_lines if j % self.major_step == 0 else minor_lines
+            lines.append(QLineF(rect.left(), y, rect.right(), y))
 
-        painter.drawText(
-            QRectF(rect.right() - 70, rect.top() + 8, 60, 16),
-            Qt.AlignmentFlag.AlignRight,
-            "units: mm",
-        )
+        painter.setPen(self._minor_pen)
+        painter.drawLines(minor_lines)
+        painter.setPen(self._major_pen)
+        painter.drawLines(major_lines)
         painter.restore()
 
+    def _grid_tile(self, zoom: float) -> QPixmap | None:
+        """Return the cached grid tile for ``zoom`` or ``None`` if out of range."""
+        key = round(zoom, 3)
+        tile = self._tile_cache.get(key)
+        if tile is None:
+            side = math.ceil(self.major_grid * zoom)
+            if not 8 <= side <= self.MAX_TILE_PX:
+                return None
+            if len(self._tile_cache) >= 16:
+                self._tile_cache.clear()
+            tile = self._render_tile(side)
+            self._tile_cache[key] = tile
+        return tile
+
+    def _render_tile(self, side: int) -> QPixmap:
+        """Paint one major cell (minor lines plus major edges) into a pixmap."""
+        tile = QPixmap(side, side)
+        # Device pixel ratio maps the tile back to exactly one major cell
+        tile.setDevicePixelRatio(side / self.major_grid)
+        tile.fill(Qt.GlobalColor.transparent)
+
+        size = self.major_grid
+        painter = QPainter(tile)
+        painter.setPen(self._minor_pen)
+        for k in range(1, self.major_step):
+            pos = k * self.grid
+            painter.drawLine(QLineF(pos, 0, pos, size))
+            painter.drawLine(QLineF(0, pos, size, pos))
+        painter.setPen(self._major_pen)
+        for pos in (0.0, size):
+            painter.drawLine(QLineF(pos, 0, pos, size))
+            painter.drawLine(QLineF(0, pos, size, pos))
+        painter.end()
+        return tile
+
     def _add_sample_geometry(self) -> None:
         """Populate scene with sample shape placeholders."""
         plate_pen = QPen(QColor("#3c7dd9"))
@@ -128,8 +246,6 @@ class CanvasScene(QGraphicsScene):
         self.shape_group.setZValue(5)
 
     def _build_cut_path(self):
-        from PyQt6.QtGui import QPainterPath
-
         path = QPainterPath(QPointF(-130, -130))
         path.lineTo(130, -130)
         path.lineTo(130, 130)
@@ -161,28 +277,30 @@ class CanvasScene(QGraphicsScene):
 class CanvasView(QGraphicsView):
     """Graphics view configured for CAD-like interaction."""
 
-    def __init__(self) -> None:
+    def __init__(self, use_opengl: bool = True) -> None:
         super().__init__(CanvasScene())
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        if use_opengl and self._opengl_available():
+            # GL repaints the whole surface anyway, so partial updates only add bookkeeping
+            self.setViewport(QOpenGLWidget())
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
         self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
         self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.setFrameShape(QFrame.Shape.NoFrame)
-        self.setStyleSheet(
-            """
-            QGraphicsView {
-                border: 1px solid #262626;
-                border-radius: 12px;
-                background-color: transparent;
-            }
-            """
-        )
+        self.setStyleSheet(_QSS)
         self.setBackgroundBrush(Qt.GlobalColor.transparent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.centerOn(0, 0)
         self._shape_state = {"rotation": 0.0, "scale": 1.0, "x_move": 0.0, "y_move": 0.0}
 
+    @staticmethod
+    def _opengl_available() -> bool:
+        """Return True when a GL context can be created (not on offscreen platforms)."""
+        return QOpenGLWidget is not None and QOpenGLContext().create()
+
     def wheelEvent(self, event):  # noqa: N802
         """Implement zoom using the mouse wheel."""
         zoom_in_factor = 1.15
@@ -196,16 +314,19 @@ class CanvasView(QGraphicsView):
 
     # ------------------------------------------------------------------ API
     def apply_parameter_change(self, key: str, value: float) -> None:
-        if key not in self._shape_state:
+        if key not in self._shape_state or self._shape_state[key] == value:
             return
         self._shape_state[key] = value
         self._apply_state()
 
     def apply_parameter_set(self, state: dict) -> None:
+        changed = False
         for key, value in state.items():
-            if key in self._shape_state:
+            if key in self._shape_state and self._shape_state[key] != value:
                 self._shape_state[key] = value
-        self._apply_state()
+                changed = True
+        if changed:
+            self._apply_state()
 
     def reset_shape(self) -> None:
         self._shape_state = {"rotation": 0.0, "scale": 1.0, "x_move": 0.0, "y_move": 0.0}
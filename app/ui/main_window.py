@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from PyQt6.QtGui import QAction
+import os
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QAction, QShowEvent
 from PyQt6.QtWidgets import (
+    QFileDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
@@ -17,6 +21,44 @@ from .canvas import CanvasView
 from .properties_panel import PropertiesPanel
 from .parts.sidebar import Sidebar, SidebarAction
 
+# Application-wide stylesheet, installed once by app.create_app and matched by
+# object name instead of recomputing styles for every widget that calls setStyleSheet.
+APP_QSS = """
+#canvasContainer {
+    background-color: #111213;
+    border-left: 1px solid #1f1f1f;
+}
+#workspaceInfo {
+    background-color: #1b1c1f;
+    border: 1px solid #232427;
+    border-radius: 6px;
+}
+QLabel#workspaceTitle {
+    color: #dddddd;
+    font-size: 18px;
+    font-weight: bold;
+}
+QLabel#infoLabel {
+    color: #aaaaaa;
+    font-size: 11px;
+}
+"""
+
+# Action metadata shared by every window instance
+SIDEBAR_ACTIONS = (
+    SidebarAction("FILES"),
+    SidebarAction("ADD"),
+    SidebarAction("SAVE"),
+    SidebarAction("CLEAR"),
+    SidebarAction("P2P"),
+)
+NAV_STEPS = (
+    NavStep("Design", "Shapes & Paths"),
+    NavStep("Place", "Workspace"),
+    NavStep("Materials", "Consumables"),
+    NavStep("Run", "Execution"),
+)
+
 
 class MainWindow(QMainWindow):
     """Robot cutter HMI composed from modular UI widgets."""
@@ -26,32 +68,33 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Robot Cutter HMI")
         self.resize(1400, 860)
 
-        self.program = self._build_mock_program()
+        self.program: CutProgram | None = None
+        self.dxf_processor = None
+        self._dxf_worker = None
+        self._initialized = False
 
-        self.sidebar = Sidebar(
-            [
-                SidebarAction("FILES"),
-                SidebarAction("ADD"),
-                SidebarAction("SAVE"),
-                SidebarAction("CLEAR"),
-                SidebarAction("P2P"),
-            ]
-        )
+        self.sidebar = Sidebar(SIDEBAR_ACTIONS)
         self.canvas = CanvasView()
         self.properties = PropertiesPanel()
-        self.bottom_nav = BottomNav(
-            [
-                NavStep("Design", "Shapes & Paths"),
-                NavStep("Place", "Workspace"),
-                NavStep("Materials", "Consumables"),
-                NavStep("Run", "Execution"),
-            ]
-        )
+        self.bottom_nav = BottomNav(NAV_STEPS)
         self._default_state = {"rotation": 0.0, "scale": 1.0, "x_move": 0.0, "y_move": 0.0}
+        # Status-bar labels per parameter key, built once instead of on every tick.
+        self._pretty = {key: key.replace("_", " ").title() for key in self._default_state}
 
-        self._build_menu()
+        # Only the workspace is built up front; the rest waits for the first frame.
         self._build_ui()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            QTimer.singleShot(0, self._deferred_init)
+
+    def _deferred_init(self) -> None:
+        """Build menus, status bar and program once the window has been painted."""
+        self._build_menu()
         self._build_status_bar()
+        self.program = self._build_mock_program()
         self._load_program(self.program)
         self._connect_signals()
 
@@ -59,7 +102,9 @@ class MainWindow(QMainWindow):
         menu = self.menuBar()
         file_menu = menu.addMenu("&File")
         file_menu.addAction(QAction("New Program", self))
-        file_menu.addAction(QAction("Open...", self))
+        open_action = QAction("Open...", self)
+        open_action.triggered.connect(self._open_dxf)
+        file_menu.addAction(open_action)
         file_menu.addAction(QAction("Save", self))
         file_menu.addSeparator()
         exit_action = QAction("Exit", self)
@@ -88,7 +133,7 @@ class MainWindow(QMainWindow):
         canvas_layout.setContentsMargins(16, 16, 16, 16)
         canvas_layout.setSpacing(12)
         title = QLabel("Workspace")
-        title.setStyleSheet("color: #dddddd; font-size: 18px; font-weight: bold;")
+        title.setObjectName("workspaceTitle")
         canvas_layout.addWidget(title)
 
         info_bar = QFrame()
@@ -96,11 +141,10 @@ class MainWindow(QMainWindow):
         info_layout = QHBoxLayout(info_bar)
         info_layout.setContentsMargins(12, 6, 12, 6)
         info_layout.setSpacing(18)
-        grid_label = QLabel(f"Grid: {int(self.canvas.scene().grid)} mm")
-        origin_label = QLabel("Origin: center (0, 0)")
-        hint_label = QLabel("Wheel = zoom · Middle drag = pan")
-        for label in (grid_label, origin_label, hint_label):
-            label.setStyleSheet("color: #aaaaaa; font-size: 11px;")
+        grid_mm = int(self.canvas.scene().grid)
+        for text in (f"Grid: {grid_mm} mm", "Origin: center (0, 0)", "Wheel = zoom · Middle drag = pan"):
+            label = QLabel(text)
+            label.setObjectName("infoLabel")
             info_layout.addWidget(label)
         info_layout.addStretch()
         canvas_layout.addWidget(info_bar)
@@ -113,27 +157,16 @@ class MainWindow(QMainWindow):
         central_layout.addWidget(self.bottom_nav, stretch=0)
         self.setCentralWidget(central)
 
-        canvas_container.setStyleSheet(
-            """
-            #canvasContainer {
-                background-color: #111213;
-                border-left: 1px solid #1f1f1f;
-            }
-            #workspaceInfo {
-                background-color: #1b1c1f;
-                border: 1px solid #232427;
-                border-radius: 6px;
-            }
-            """
-        )
-
     def _build_status_bar(self) -> None:
         status = QStatusBar()
         status.showMessage("Ready")
         self.setStatusBar(status)
+        self._status = status
 
     def _connect_signals(self) -> None:
         self.sidebar.actionTriggered.connect(self._on_sidebar_action)
+        # Same-thread GUI signals keep the default connection type; only the
+        # DXFWorker signals (see _load_dxf) cross threads and are queued.
         self.properties.parameterChanged.connect(self._on_parameter_changed)
         self.properties.parametersCommitted.connect(self._on_parameters_committed)
         self.properties.deleteRequested.connect(self._on_delete_requested)
@@ -143,44 +176,83 @@ class MainWindow(QMainWindow):
         part = CutShape(
             name="Base Plate",
             kind="plate",
-            parameters=[
+            parameters=(
                 ShapeParameter("rotation", "Rotation (°)", 0),
                 ShapeParameter("scale", "Scale", 1),
                 ShapeParameter("x_move", "X Move", 0),
                 ShapeParameter("y_move", "Y Move", 0),
-            ],
+            ),
         )
-        return CutProgram("Sample Plate", [part])
+        return CutProgram("Sample Plate", (part,))
 
     def _load_program(self, program: CutProgram) -> None:
         if not program.shapes:
             return
         shape = program.shapes[0]
         self.properties.update_parameters(shape.parameters)
-        state = {param.key: param.value for param in shape.parameters}
-        self.canvas.apply_parameter_set(state)
-        self.properties.set_parameter_values(state)
+        self.canvas.apply_parameter_set(shape.state)
+        self.properties.set_parameter_values(shape.state)
 
     # ------------------------------------------------------------------ Slots
     def _on_sidebar_action(self, name: str) -> None:
-        self.statusBar().showMessage(f"{name.title()} action selected")
+        self._status.showMessage(f"{name.title()} action selected")
         if name == "CLEAR":
             self.properties.set_parameter_values(self._default_state)
             self.canvas.reset_shape()
-            self.statusBar().showMessage("Workspace reset to origin")
+            self._status.showMessage("Workspace reset to origin")
 
     def _on_parameter_changed(self, key: str, value: float) -> None:
+        # PropertiesPanel already debounces its edits; apply each emission directly
         self.canvas.apply_parameter_change(key, value)
-        display_value = f"{value:.2f}" if key != "scale" else f"{value:.2f}x"
-        self.statusBar().showMessage(f"{key.replace('_', ' ').title()} -> {display_value}")
+        label = self._pretty.get(key)
+        if label is None:
+            label = self._pretty[key] = key.replace("_", " ").title()
+        self._status.showMessage(f"{label} -> {value:.2f}{'x' if key == 'scale' else ''}")
 
     def _on_parameters_committed(self, values: dict) -> None:
         self.canvas.apply_parameter_set(values)
         self.properties.set_parameter_values(values)
-        self.statusBar().showMessage("Parameters committed to workspace")
+        self._status.showMessage("Parameters committed to workspace")
 
     def _on_delete_requested(self) -> None:
-        self.statusBar().showMessage("Delete requested (placeholder action)")
+        self._status.showMessage("Delete requested (placeholder action)")
 
     def _on_pattern_requested(self) -> None:
-        self.statusBar().showMessage("Pattern generator coming soon")
+        self._status.showMessage("Pattern generator coming soon")
+
+    def _open_dxf(self) -> None:
+        """Process a DXF file on the thread pool so the GUI stays responsive."""
+        path, _ = QFileDialog.getOpenFileName(self, "Open DXF", "", "DXF Files (*.dxf)")
+        if path:
+            self._load_dxf(path)
+
+    def _load_dxf(self, path: str) -> None:
+        # Imported on first use: shapely/GEOS is not needed to start the HMI.
+        from ..core.dxf_worker import DXFWorker
+
+        self._status.showMessage(f"Processing {os.path.basename(path)}...")
+        self._dxf_worker = DXFWorker(path)
+        self._dxf_worker.signals.finished.connect(
+            self._on_dxf_processed, Qt.ConnectionType.QueuedConnection
+        )
+        self._dxf_worker.signals.failed.connect(
+            self._on_dxf_failed, Qt.ConnectionType.QueuedConnection
+        )
+        self._dxf_worker.start()
+
+    def _on_dxf_processed(self, processor, _result) -> None:
+        if self._dxf_worker is None or self.sender() is not self._dxf_worker.signals:
+            return  # result of a load superseded by a newer one
+        self._dxf_worker = None
+        self.dxf_processor = processor
+        stats = processor.get_statistics()
+        self._status.showMessage(
+            f"DXF loaded: {stats['final_trajectories']} trajectories "
+            f"from {stats['original_entities']} entities"
+        )
+
+    def _on_dxf_failed(self, error: str) -> None:
+        if self._dxf_worker is None or self.sender() is not self._dxf_worker.signals:
+            return  # result of a load superseded by a newer one
+        self._dxf_worker = None
+        self._status.showMessage(f"Could not load DXF: {error}")
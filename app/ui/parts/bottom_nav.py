@@ -7,7 +7,32 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QFrame, QLabel, QHBoxLayout, QVBoxLayout, QWidget
 
 
-@dataclass
+# Steps are styled from the bar so each StepWidget does not parse its own sheet
+_QSS = """
+#bottomNav {
+    background-color: #111111;
+    border-top: 1px solid #303030;
+}
+#stepWidget {
+    background-color: #1f1f1f;
+    color: #f5f5f5;
+    border-radius: 6px;
+    border: 1px solid #2a2a2a;
+}
+#stepWidget:hover {
+    background-color: #2c2c2c;
+}
+#stepTitle {
+    font-weight: bold;
+}
+#stepSubtitle {
+    font-size: 10px;
+    color: #bbbbbb;
+}
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class NavStep:
     title: str
     subtitle: str | None = None
@@ -24,28 +49,14 @@ class StepWidget(QFrame):
         layout.setContentsMargins(16, 10, 16, 10)
         title = QLabel(step.title)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-weight: bold;")
+        title.setObjectName("stepTitle")
         layout.addWidget(title)
         if step.subtitle:
             subtitle = QLabel(step.subtitle)
             subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            subtitle.setStyleSheet("font-size: 10px; color: #bbbbbb;")
+            subtitle.setObjectName("stepSubtitle")
             layout.addWidget(subtitle)
 
-        self.setStyleSheet(
-            """
-            #stepWidget {
-                background-color: #1f1f1f;
-                color: #f5f5f5;
-                border-radius: 6px;
-                border: 1px solid #2a2a2a;
-            }
-            #stepWidget:hover {
-                background-color: #2c2c2c;
-            }
-            """
-        )
-
 
 class BottomNav(QFrame):
     """Workflow navigation bar similar to the reference UI."""
@@ -62,11 +73,4 @@ class BottomNav(QFrame):
         self._apply_style()
 
     def _apply_style(self) -> None:
-        self.setStyleSheet(
-            """
-            #bottomNav {
-                background-color: #111111;
-                border-top: 1px solid #303030;
-            }
-            """
-        )
+        self.setStyleSheet(_QSS)
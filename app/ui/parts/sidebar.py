@@ -5,10 +5,39 @@ from typing import Iterable
 
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QButtonGroup, QFrame, QToolButton, QVBoxLayout, QSizePolicy
+from PyQt6.QtWidgets import QAbstractButton, QButtonGroup, QFrame, QToolButton, QVBoxLayout, QSizePolicy
 
 
-@dataclass
+_QSS = """
+#sidebar {
+    background-color: #151515;
+    color: #f0f0f0;
+}
+#sidebar QToolButton {
+    border: 2px solid #245983;
+    padding: 12px 4px;
+    font-size: 12px;
+    background-color: transparent;
+    border-radius: 8px;
+    margin: 6px 8px;
+    font-weight: 600;
+    color: #d8dce2;
+}
+#sidebar QToolButton:checked {
+    background-color: #2f6ba5;
+    border-color: #5aa4db;
+    color: white;
+}
+#sidebar QToolButton:hover {
+    background-color: rgba(47,107,165,0.25);
+}
+#sidebar QToolButton::menu-indicator {
+    image: none;
+}
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class SidebarAction:
     text: str
     icon: QIcon | None = None
@@ -29,7 +58,9 @@ class Sidebar(QFrame):
         self._group = QButtonGroup(self)
         self._group.setExclusive(True)
         self._buttons: dict[str, QToolButton] = {}
+        self._button_to_name: dict[QAbstractButton, str] = {}
         self._build_buttons(actions)
+        self._group.buttonToggled.connect(self._on_button_toggled)
         self._apply_style()
 
     def _build_buttons(self, actions: Iterable[SidebarAction]) -> None:
@@ -45,47 +76,16 @@ class Sidebar(QFrame):
             self._layout.addWidget(button)
             self._group.addButton(button)
             self._buttons[action.text] = button
-            button.toggled.connect(self._make_toggle_handler(action.text))
+            self._button_to_name[button] = action.text
             if index == 0:
                 button.setChecked(True)
 
     def _apply_style(self) -> None:
-        self.setStyleSheet(
-            """
-            #sidebar {
-                background-color: #151515;
-                color: #f0f0f0;
-            }
-            #sidebar QToolButton {
-                border: 2px solid #245983;
-                padding: 12px 4px;
-                font-size: 12px;
-                background-color: transparent;
-                border-radius: 8px;
-                margin: 6px 8px;
-                font-weight: 600;
-                color: #d8dce2;
-            }
-            #sidebar QToolButton:checked {
-                background-color: #2f6ba5;
-                border-color: #5aa4db;
-                color: white;
-            }
-            #sidebar QToolButton:hover {
-                background-color: rgba(47,107,165,0.25);
-            }
-            #sidebar QToolButton::menu-indicator {
-                image: none;
-            }
-            """
-        )
-
-    def _make_toggle_handler(self, name: str):
-        def handler(checked: bool) -> None:
-            if checked:
-                self.actionTriggered.emit(name)
+        self.setStyleSheet(_QSS)
 
-        return handler
+    def _on_button_toggled(self, button: QAbstractButton, checked: bool) -> None:
+        if checked:
+            self.actionTriggered.emit(self._button_to_name[button])
 
     def trigger_action(self, name: str) -> None:
         """Programmatically activate a sidebar button."""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
     QDoubleSpinBox,
@@ -17,6 +17,51 @@ from PyQt6.QtWidgets import (
 from ..data import ShapeParameter
 
 
+_QSS = """
+#propertiesPanel {
+    background-color: #202020;
+    color: #f2f2f2;
+}
+#propertiesPanel QDoubleSpinBox,
+#propertiesPanel QComboBox {
+    background-color: #2a2a2a;
+    border: 1px solid #3e3e3e;
+    padding: 4px 6px;
+}
+#propertiesPanel QPushButton {
+    border: 1px solid #3e3e3e;
+    padding: 8px 14px;
+    border-radius: 4px;
+    background-color: #2a2a2a;
+}
+#propertiesPanel QPushButton:hover {
+    background-color: #3a3a3a;
+}
+#propertiesPanel #deleteBtn {
+    border-color: #8b1a1a;
+    background-color: #5a1a1a;
+}
+#propertiesPanel #deleteBtn:hover {
+    background-color: #7a2020;
+}
+#propertiesPanel #doneBtn {
+    border-color: #256c9e;
+    background-color: #1f4d7a;
+}
+#propertiesPanel #doneBtn:hover {
+    background-color: #296194;
+}
+#propertiesPanel QLabel {
+    font-size: 12px;
+    color: #dddddd;
+}
+#propertiesPanel QLabel#panelTitle {
+    font-size: 16px;
+    font-weight: bold;
+}
+"""
+
+
 class PropertiesPanel(QFrame):
     """Parameter editor for the selected shape."""
 
@@ -30,7 +75,7 @@ class PropertiesPanel(QFrame):
         self.setObjectName("propertiesPanel")
         self.setMinimumWidth(220)
         self._title = QLabel("Edit Closed Shape")
-        self._title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self._title.setObjectName("panelTitle")
         self._side_selector = QComboBox()
         self._side_selector.addItems(["Inside", "Outside"])
         self._form = QFormLayout()
@@ -48,6 +93,13 @@ class PropertiesPanel(QFrame):
         self._editors: dict[str, QDoubleSpinBox] = {}
         self._current_values: dict[str, float] = {}
 
+        # Coalesce rapid spin box edits into at most one emission per key every 30 ms
+        self._pending: dict[str, float] = {}
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(30)
+        self._debounce.timeout.connect(self._flush_pending)
+
         self._build_layout()
         self._apply_style()
         self.update_parameters(
@@ -86,56 +138,32 @@ class PropertiesPanel(QFrame):
         self._done_btn.clicked.connect(self._emit_commit)
 
     def _apply_style(self) -> None:
-        self.setStyleSheet(
-            """
-            #propertiesPanel {
-                background-color: #202020;
-                color: #f2f2f2;
-            }
-            #propertiesPanel QDoubleSpinBox,
-            #propertiesPanel QComboBox {
-                background-color: #2a2a2a;
-                border: 1px solid #3e3e3e;
-                padding: 4px 6px;
-            }
-            #propertiesPanel QPushButton {
-                border: 1px solid #3e3e3e;
-                padding: 8px 14px;
-                border-radius: 4px;
-                background-color: #2a2a2a;
-            }
-            #propertiesPanel QPushButton:hover {
-                background-color: #3a3a3a;
-            }
-            #propertiesPanel #deleteBtn {
-                border-color: #8b1a1a;
-                background-color: #5a1a1a;
-            }
-            #propertiesPanel #deleteBtn:hover {
-                background-color: #7a2020;
-            }
-            #propertiesPanel #doneBtn {
-                border-color: #256c9e;
-                background-color: #1f4d7a;
-            }
-            #propertiesPanel #doneBtn:hover {
-                background-color: #296194;
-            }
-            #propertiesPanel QLabel {
-                font-size: 12px;
-                color: #dddddd;
-            }
-            """
-        )
+        self.setStyleSheet(_QSS)
 
     def update_parameters(self, params: Iterable[ShapeParameter]) -> None:
         """Rebuild the editor form using the provided parameter descriptors."""
-        # Clear current rows
+        params = list(params)
+        self._current_values = {param.key: param.value for param in params}
+        self._pending.clear()
+
+        # Same schema: reuse the existing spin boxes instead of rebuilding rows
+        if [param.key for param in params] == list(self._editors):
+            for param in params:
+                editor = self._editors[param.key]
+                label = self._form.labelForField(editor)
+                if isinstance(label, QLabel):
+                    label.setText(param.label)
+                editor.blockSignals(True)
+                editor.setRange(param.minimum, param.maximum)
+                editor.setValue(param.value)
+                editor.blockSignals(False)
+            return
+
+        # Clear current rows (from the tail to avoid shifting the remaining ones)
         while self._form.rowCount():
-            self._form.removeRow(0)
+            self._form.removeRow(self._form.rowCount() - 1)
 
         self._editors.clear()
-        self._current_values = {param.key: param.value for param in params}
 
         for param in params:
             editor = QDoubleSpinBox()
@@ -153,10 +181,16 @@ class PropertiesPanel(QFrame):
     def _make_value_changed_handler(self, key: str):
         def handler(value: float) -> None:
             self._current_values[key] = value
-            self.parameterChanged.emit(key, value)
+            self._pending[key] = value
+            self._debounce.start()
 
         return handler
 
+    def _flush_pending(self) -> None:
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            self.parameterChanged.emit(key, value)
+
     def _emit_commit(self) -> None:
         self.parametersCommitted.emit(dict(self._current_values))
 
@@ -166,7 +200,11 @@ class PropertiesPanel(QFrame):
             editor = self._editors.get(key)
             if editor is None:
                 continue
+            self._current_values[key] = value
+            # External state wins over edits still waiting in the debounce window
+            self._pending.pop(key, None)
+            if abs(editor.value() - value) < 1e-9:
+                continue
             editor.blockSignals(True)
             editor.setValue(value)
             editor.blockSignals(False)
-            self._current_values[key] = value
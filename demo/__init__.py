@@ -0,0 +1,10 @@
+import numpy as np
+
+# Muestras de trayectoria por segundo en la simulación, común a los dos
+# canvas (matplotlib y pyqtgraph): la velocidad no depende del backend
+SAMPLE_HZ = 20.0
+
+
+def with_breaks(xy: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Inserta un NaN entre trayectorias para dibujarlas de una vez (matplotlib y pyqtgraph cortan en los NaN)"""
+    return np.insert(xy, starts[1:-1], np.nan, axis=0)
@@ -1,18 +1,86 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import QTimer
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.animation import FuncAnimation
-import pandas as pd
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.transforms import Bbox
+import numpy as np
+import queue
+import threading
+import time
+
+from . import SAMPLE_HZ, with_breaks
+
+class _TrajectoryProducer(threading.Thread):
+    """Genera las muestras de la simulación fuera del hilo de la GUI.
+
+    Nunca toca objetos Qt: sólo empuja (x, y) a una cola acotada, al ritmo
+    `rate_hz`, y un None al terminar.
+    """
+    
+    def __init__(self, x: np.ndarray, y: np.ndarray, out: queue.Queue, rate_hz: float):
+        super().__init__(daemon=True)
+        self.x, self.y = x, y
+        self.out = out
+        self.period = 1.0 / rate_hz
+        self.stop_event = threading.Event()
+    
+    def _put(self, item) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                self.out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def run(self):
+        next_t = time.monotonic()
+        for i in range(len(self.x)):
+            # Aquí iría el cálculo por muestra (cinemática inversa, etc.)
+            if not self._put((self.x[i], self.y[i])):
+                return
+            next_t += self.period
+            delay = next_t - time.monotonic()
+            if delay > 0 and self.stop_event.wait(delay):
+                return
+        self._put(None)
+
 
 class CanvasWidget(QWidget):
+    # Muestras por segundo de la simulación; el refresco se toma de la pantalla
+    SAMPLE_HZ = SAMPLE_HZ
+    REFRESH_HZ = 60.0
+    EMA_ALPHA = 0.2
+    
     def __init__(self):
         super().__init__()
         self.setup_ui()
-        self.simulation_animation = None
+        self.edit_line = None
+        self.sim_point = None
+        self._bg = None
+        # Buffers de un elemento reutilizados en cada frame del marcador
+        self._xbuf = np.empty(1)
+        self._ybuf = np.empty(1)
+        # Rectángulo (px) del marcador en el último frame: sólo se copia a
+        # pantalla la unión del anterior y el nuevo, no todo el eje
+        self._marker_box = None
+        self._marker_radius = 0.0
+        
+        # Productor en otro hilo -> cola acotada -> QTimer consumidor en la GUI.
+        # El consumidor dibuja por blitting sólo el rectángulo de los ejes
+        self._queue = queue.Queue(maxsize=64)
+        self._producer = None
+        self._frame_period = 1.0 / self.REFRESH_HZ
+        self._last_draw = 0.0
+        self._avg_draw = 0.0    # EMA del tiempo de dibujo (s)
+        self.simulation_timer = QTimer(self)
+        self.simulation_timer.setInterval(int(1000 / self.REFRESH_HZ))
+        self.simulation_timer.timeout.connect(self._update_simulation)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
+        plt.style.use('fast')
         self.figure, self.ax = plt.subplots(figsize=(10, 8))
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
@@ -26,54 +94,139 @@ class CanvasWidget(QWidget):
         self.ax.set_ylabel("Y [mm]")
         self.ax.grid(True, alpha=0.3)
         self.ax.set_aspect('equal')
+        # Límites fijos (ver _fit_limits): sin autoscale en cada redibujo
+        self.ax.set_autoscale_on(False)
+    
+    def _clear_artists(self):
+        """Quitar sólo las líneas y la leyenda añadidas; título, ejes y grilla se conservan"""
+        for line in list(self.ax.lines):
+            line.remove()
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        self.edit_line = None
+    
+    def _fit_limits(self, x: np.ndarray, y: np.ndarray, margin: float = 0.05):
+        """Fijar los límites de los ejes al rectángulo de los datos (NaN ignorados)"""
+        if not np.isfinite(x).any():
+            return
+        x0, x1 = np.nanmin(x), np.nanmax(x)
+        y0, y1 = np.nanmin(y), np.nanmax(y)
+        dx = (x1 - x0) * margin or 1.0
+        dy = (y1 - y0) * margin or 1.0
+        self.ax.set_xlim(x0 - dx, x1 + dx)
+        self.ax.set_ylim(y0 - dy, y1 + dy)
     
     def plot_geometries(self, geometries):
         """Dibujar geometrías en el canvas"""
-        self.ax.clear()
-        self.setup_plot()
+        self._stop_simulation()
+        self._clear_artists()
         
+        bounds = []
         for i, geom in enumerate(geometries):
             x, y = geom.xy
             self.ax.plot(x, y, linewidth=2, label=f"Trayectoria {i+1}")
+            bounds.append(geom.bounds)
         
-        self.ax.legend()
+        if bounds:
+            b = np.asarray(bounds)
+            self._fit_limits(b[:, [0, 2]].ravel(), b[:, [1, 3]].ravel())
+            self.ax.legend()
         self.canvas.draw()
     
-    def start_simulation(self, trajectory_df: pd.DataFrame):
-        """Iniciar simulación animada"""
-        self.ax.clear()
-        self.setup_plot()
+    def update_arrays(self, xy: np.ndarray, starts: np.ndarray):
+        """Redibujar las trayectorias editadas (trayectoria k = xy[starts[k]:starts[k+1]])"""
+        xy = with_breaks(xy, starts)
+        if self.edit_line is None:
+            self._stop_simulation()
+            self._clear_artists()
+            self.edit_line, = self.ax.plot(xy[:, 0], xy[:, 1], linewidth=2)
+        else:
+            self.edit_line.set_data(xy[:, 0], xy[:, 1])
+        self._fit_limits(xy[:, 0], xy[:, 1])
+        self.canvas.draw_idle()
+    
+    def start_simulation(self, xy: np.ndarray, starts: np.ndarray):
+        """Iniciar simulación animada (trayectoria k = xy[starts[k]:starts[k+1]])"""
+        self._stop_simulation()
+        self._clear_artists()
         
-        # Plot todas las trayectorias
-        for traj_id in trajectory_df['trajectory_id'].unique():
-            traj_data = trajectory_df[
-                (trajectory_df['trajectory_id'] == traj_id) & 
-                (trajectory_df['point_type'] == 'path')
-            ]
-            if not traj_data.empty:
-                self.ax.plot(traj_data['x'], traj_data['y'], 'b-', alpha=0.3, linewidth=1)
+        # Todas las trayectorias en un solo artista (matplotlib corta en los NaN)
+        path = with_breaks(xy, starts)
+        self.ax.plot(path[:, 0], path[:, 1], 'b-', alpha=0.3, linewidth=1)
+        self._fit_limits(xy[:, 0], xy[:, 1])
         
         # Punto para animación
-        self.sim_point, = self.ax.plot([], [], 'ro', markersize=6, label='Posición Actual')
+        self.sim_point, = self.ax.plot([], [], 'ro', markersize=6, label='Posición Actual',
+                                       animated=True)
+        self._marker_radius = self.sim_point.get_markersize() * self.figure.dpi / 72 / 2 + 2
         self.ax.legend()
         
         # Preparar datos para animación
-        path_points = trajectory_df[trajectory_df['point_type'] == 'path']
-        self.sim_data = list(zip(path_points['x'], path_points['y']))
-        self.current_index = 0
-        
-        # Iniciar animación
-        self.simulation_animation = FuncAnimation(
-            self.figure, self._update_simulation,
-            frames=len(self.sim_data), interval=50, repeat=False, blit=True
-        )
+        self.sim_x = np.ascontiguousarray(xy[:, 0], dtype=np.float64)
+        self.sim_y = np.ascontiguousarray(xy[:, 1], dtype=np.float64)
         
+        # Dibujo completo una vez (guarda el fondo en _on_draw) y animar
         self.canvas.draw()
+        self._queue = queue.Queue(maxsize=64)
+        self._producer = _TrajectoryProducer(self.sim_x, self.sim_y, self._queue, self.SAMPLE_HZ)
+        self._producer.start()
+        
+        # No tiene sentido dibujar más rápido que el refresco de la pantalla
+        screen = self.screen()
+        hz = (screen.refreshRate() if screen is not None else 0.0) or self.REFRESH_HZ
+        self._frame_period = 1.0 / hz
+        self._last_draw = 0.0
+        self.simulation_timer.setInterval(max(1, int(1000 / hz)))
+        self.simulation_timer.start()
+    
+    def _on_draw(self, event):
+        """Tras cada dibujo completo (inicio, resize, zoom) se guarda el fondo"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._marker_box = None
+        if self.sim_point is not None:
+            self.ax.draw_artist(self.sim_point)
+    
+    def _stop_simulation(self):
+        self.simulation_timer.stop()
+        if self._producer is not None:
+            self._producer.stop_event.set()
+            self._producer = None
+        self.sim_point = None
     
-    def _update_simulation(self, frame):
-        """Actualizar frame de simulación"""
-        if self.current_index < len(self.sim_data):
-            x, y = self.sim_data[self.current_index]
-            self.sim_point.set_data([x], [y])
-            self.current_index += 1
-        return [self.sim_point]
\ No newline at end of file
+    def _update_simulation(self):
+        """Consumir la cola: se queda con la última muestra y la dibuja por blitting"""
+        # Si el timer se adelanta al próximo refresco se salta el frame; las
+        # muestras siguen en la cola y se agrupan en el siguiente
+        start = time.monotonic()
+        if start - self._last_draw < self._frame_period - self._avg_draw:
+            return
+        
+        last, finished = None, False
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                finished = True
+                break
+            last = item
+        
+        if last is not None and self._bg is not None:
+            self._xbuf[0], self._ybuf[0] = last
+            self.canvas.restore_region(self._bg)
+            self.sim_point.set_data(self._xbuf, self._ybuf)
+            self.ax.draw_artist(self.sim_point)
+            
+            px, py = self.ax.transData.transform((last[0], last[1]))
+            r = self._marker_radius
+            box = Bbox.from_extents(px - r, py - r, px + r, py + r)
+            dirty = box if self._marker_box is None else Bbox.union([self._marker_box, box])
+            self.canvas.blit(Bbox.intersection(dirty, self.ax.bbox) or self.ax.bbox)
+            self._marker_box = box
+            self._last_draw = time.monotonic()
+            self._avg_draw += self.EMA_ALPHA * (self._last_draw - start - self._avg_draw)
+        if finished:
+            self.simulation_timer.stop()
+            self._producer = None
@@ -1,22 +1,84 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QStatusBar, QMessageBox, QFileDialog, QMenuBar, QAction)
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon
-import pandas as pd
+                            QStatusBar, QMessageBox, QFileDialog, QMenuBar)
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QAction, QIcon
+from typing import TYPE_CHECKING, Optional, Tuple
+import os
+import numpy as np
+import shapely
 
-from .sidebar import Sidebar
-from .canvas import CanvasWidget
+from .sidebar import EditState, Sidebar
+# pyqtgraph es opcional: si no está instalado se usa el canvas de matplotlib
+try:
+    from .pg_canvas import PgCanvasWidget as CanvasWidget
+except ImportError:
+    from .canvas import CanvasWidget
 from app.core.dxf_processor import DXFProcessor
+from app.core.dxf_worker import DXFWorker
+from app.core.transform import affine_xy, warmup as warmup_transform
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Sin iconos por carpeta ni resolución de symlinks: el diálogo no hace stat
+# de cada archivo (lento en carpetas grandes o unidades de red)
+_DIALOG_OPTIONS = (QFileDialog.Option.DontUseCustomDirectoryIcons
+                   | QFileDialog.Option.DontResolveSymlinks)
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.dxf_processor = DXFProcessor()
-        self.trajectory_df = None
+        # Coordenadas originales (_src, float64: fuente de verdad para exportar) y
+        # copia float32 sólo para dibujar (_src32 -> _view, búfer reutilizado), sin
+        # separadores: la trayectoria k es xy[starts[k]:starts[k+1]].
+        # El DataFrame se reconstruye sólo cuando alguien lo pide
+        self._src = None
+        self._src32 = None
+        self._view = None
+        self._starts = None
+        self._df = None
+        self._edit = EditState()
         self.current_file = None
+        self._last_dir = ""
+        self._dxf_worker = None
         self.setup_ui()
         self.setup_connections()
         
+        # Compilar el kernel de transformación (si hay Numba) fuera de la GUI
+        QThreadPool.globalInstance().start(warmup_transform)
+        
+    @property
+    def trajectory_df(self) -> Optional["pd.DataFrame"]:
+        """Trayectorias (con la edición actual) como DataFrame"""
+        if self._df is None and self._src is not None:
+            # pandas sólo se carga cuando alguien pide el DataFrame
+            import pandas as pd
+            
+            # La edición se recalcula en float64 sobre los originales, no desde la vista
+            xy = affine_xy(self._src, np.empty_like(self._src), _edit_matrix(self._edit))
+            self._df = pd.DataFrame({
+                'x': xy[:, 0],
+                'y': xy[:, 1],
+                'trajectory_id': np.repeat(np.arange(len(self._starts) - 1),
+                                           np.diff(self._starts)),
+            })
+        return self._df
+    
+    def _set_trajectories(self, xy: Optional[np.ndarray], starts: Optional[np.ndarray]):
+        """Instala nuevas trayectorias (o ninguna) y reinicia la edición"""
+        self._df = None
+        if xy is None:
+            self._src = self._src32 = self._view = self._starts = None
+        else:
+            self._src = np.ascontiguousarray(xy, dtype=np.float64)
+            self._src32 = self._src.astype(np.float32)
+            self._view = self._src32.copy()
+            self._starts = starts
+        self._edit = EditState()
+        # Los controles deben mostrar la edición que realmente se aplica
+        self.sidebar.reset_edit()
+    
     def setup_ui(self):
         self.setWindowTitle("ROBOT CORTADOR - HMI")
         self.setGeometry(100, 100, 1600, 900)
@@ -64,56 +126,69 @@ class MainWindow(QMainWindow):
         self.sidebar.runRequested.connect(self.run_execution)
         
         # Señales de edición
-        self.sidebar.scaleChanged.connect(self.apply_scale)
-        self.sidebar.moveXChanged.connect(self.apply_move_x)
-        self.sidebar.moveYChanged.connect(self.apply_move_y)
-        self.sidebar.relationChanged.connect(self.apply_rotation)
+        # Misma hebra: conexión directa, sin comprobar afinidad en cada emisión
+        self.sidebar.editChanged.connect(
+            self.on_edit_changed, Qt.ConnectionType.DirectConnection)
         
     def load_dxf(self):
         """Cargar archivo DXF"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Seleccionar archivo DXF", "", "DXF Files (*.dxf)")
+            self, "Seleccionar archivo DXF", self._last_dir, "DXF Files (*.dxf)",
+            options=_DIALOG_OPTIONS)
         
         if file_path:
+            self._last_dir = os.path.dirname(file_path)
             self.current_file = file_path
             self.status_bar.showMessage(f"Procesando DXF: {file_path}")
             
-            try:
-                success = self.dxf_processor.process_file(file_path)
-                
-                if success:
-                    # Convertir a DataFrame
-                    self.trajectory_df = self.geometries_to_dataframe()
-                    
-                    # Actualizar UI
-                    self.canvas.plot_geometries(self.dxf_processor.merged_geoms)
-                    
-                    # Actualizar sidebar
-                    file_name = file_path.split('/')[-1]
-                    self.sidebar.update_files_info(f"📁 {file_name}")
-                    
-                    # Habilitar acciones
-                    self.sidebar.set_main_action_enabled("Generar Trayectoria", True)
-                    self.sidebar.set_main_action_enabled("Simular Corte", True)
-                    self.sidebar.set_main_action_enabled("Exportar", True)
-                    
-                    # Mostrar estadísticas
-                    stats = self.dxf_processor.get_statistics()
-                    self.status_bar.showMessage(
-                        f"✅ DXF cargado: {stats['final_trajectories']} trayectorias, "
-                        f"{len(self.trajectory_df)} puntos"
-                    )
-                    
-                else:
-                    self.status_bar.showMessage("❌ Error procesando DXF")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"No se pudo cargar el DXF:\n{str(e)}")
-                self.status_bar.showMessage("❌ Error cargando DXF")
+            # Los arreglos también se arman en el worker; los slots corren en el hilo de la GUI
+            self._dxf_worker = DXFWorker(
+                file_path, self.dxf_processor.tolerance,
+                postprocess=lambda p: geometries_to_arrays(p.merged_geoms))
+            self._dxf_worker.signals.finished.connect(
+                self.on_dxf_processed, Qt.ConnectionType.QueuedConnection)
+            self._dxf_worker.signals.failed.connect(
+                self.on_dxf_failed, Qt.ConnectionType.QueuedConnection)
+            self._dxf_worker.start()
+    
+    def on_dxf_processed(self, processor: DXFProcessor, arrays: Tuple[np.ndarray, np.ndarray]):
+        """DXF procesado (y convertido a arreglos) en segundo plano"""
+        if self._dxf_worker is None or self.sender() is not self._dxf_worker.signals:
+            return  # Resultado de una carga ya reemplazada por otra más reciente
+        self.dxf_processor = processor
+        self._dxf_worker = None
+        self._set_trajectories(*arrays)
+        
+        # Actualizar UI
+        self.canvas.plot_geometries(self.dxf_processor.merged_geoms)
+        
+        # Actualizar sidebar
+        file_name = self.current_file.split('/')[-1]
+        self.sidebar.update_files_info(f"📁 {file_name}")
+        
+        # Habilitar acciones
+        self.sidebar.set_main_action_enabled("Generar Trayectoria", True)
+        self.sidebar.set_main_action_enabled("Simular Corte", True)
+        self.sidebar.set_main_action_enabled("Exportar", True)
+        
+        # Mostrar estadísticas
+        stats = self.dxf_processor.get_statistics()
+        self.status_bar.showMessage(
+            f"✅ DXF cargado: {stats['final_trajectories']} trayectorias, "
+            f"{len(self._src)} puntos"
+        )
+    
+    def on_dxf_failed(self, error: str):
+        """Error reportado por el worker"""
+        if self._dxf_worker is None or self.sender() is not self._dxf_worker.signals:
+            return  # Resultado de una carga ya reemplazada por otra más reciente
+        self._dxf_worker = None
+        QMessageBox.critical(self, "Error", f"No se pudo cargar el DXF:\n{error}")
+        self.status_bar.showMessage("❌ Error cargando DXF")
     
     def generate_trajectory(self):
         """Generar trayectoria a partir del DXF"""
-        if self.trajectory_df is not None:
+        if self._src is not None:
             self.status_bar.showMessage("🔄 Generando trayectoria optimizada...")
             
             # Aquí iría la lógica de optimización de trayectoria
@@ -121,19 +196,28 @@ class MainWindow(QMainWindow):
     
     def simulate_cutting(self):
         """Simular proceso de corte"""
-        if self.trajectory_df is not None:
+        if self._src is not None:
             self.status_bar.showMessage("🎬 Iniciando simulación de corte...")
-            self.canvas.start_simulation(self.trajectory_df)
+            self.canvas.start_simulation(self._view, self._starts)
     
     def export_trajectory(self):
         """Exportar trayectoria"""
-        if self.trajectory_df is not None:
+        # Sólo se comprueba que haya datos: el DataFrame (y pandas) se crean al escribir
+        if self._src is not None:
             file_path, _ = QFileDialog.getSaveFileName(
-                self, "Exportar Trayectoria", "trayectoria_robot.txt", "Text Files (*.txt)")
+                self, "Exportar Trayectoria",
+                os.path.join(self._last_dir, "trayectoria_robot.txt"), "Text Files (*.txt)",
+                options=_DIALOG_OPTIONS)
             
             if file_path:
                 try:
-                    # Exportar lógica
+                    # Coordenadas editadas en float64, mismo formato que DXFProcessor.export_to_txt
+                    xy = self.trajectory_df[['x', 'y']].to_numpy()
+                    with open(file_path, 'w', buffering=1 << 20) as f:
+                        f.write("X Y\n")
+                        for a, b in zip(self._starts[:-1], self._starts[1:]):
+                            np.savetxt(f, xy[a:b], fmt="%.6f %.6f")
+                            f.write("NaN NaN\n")
                     self.status_bar.showMessage(f"✅ Trayectoria exportada: {file_path}")
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Error exportando:\n{str(e)}")
@@ -154,7 +238,7 @@ class MainWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.trajectory_df = None
+            self._set_trajectories(None, None)
             self.current_file = None
             self.canvas.clear()
             self.sidebar.update_files_info("No hay archivos cargados")
@@ -170,36 +254,37 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("🚀 Ejecutando en robot...")
     
     # Métodos de edición
-    def apply_scale(self, scale: float):
-        if self.trajectory_df is not None:
-            self.status_bar.showMessage(f"🔍 Escala aplicada: {scale}x")
-    
-    def apply_move_x(self, move_x: float):
-        if self.trajectory_df is not None:
-            self.status_bar.showMessage(f"↔️ Movimiento X: {move_x} mm")
-    
-    def apply_move_y(self, move_y: float):
-        if self.trajectory_df is not None:
-            self.status_bar.showMessage(f"↕️ Movimiento Y: {move_y} mm")
-    
-    def apply_rotation(self, angle: float):
-        if self.trajectory_df is not None:
-            self.status_bar.showMessage(f"🔄 Rotación: {angle}°")
-    
-    def geometries_to_dataframe(self) -> pd.DataFrame:
-        """Convertir geometrías a DataFrame"""
-        points = []
-        
-        for i, geom in enumerate(self.dxf_processor.merged_geoms):
-            x, y = geom.xy
-            for xi, yi in zip(x, y):
-                points.append({
-                    'x': xi, 'y': yi, 
-                    'trajectory_id': i, 'point_type': 'path'
-                })
-            points.append({
-                'x': None, 'y': None,
-                'trajectory_id': i, 'point_type': 'separator'
-            })
-            
-        return pd.DataFrame(points)
\ No newline at end of file
+    def on_edit_changed(self, state: EditState):
+        """Aplica escala, rotación y desplazamiento como una sola afín"""
+        self._edit = state
+        if self._src is None:
+            return
+        e = state
+        affine_xy(self._src32, self._view, _edit_matrix(e))
+        self._df = None
+        self.canvas.update_arrays(self._view, self._starts)
+        self.status_bar.showMessage(
+            f"✏️ Escala {e.scale}x | Rotación {e.rot}° | "
+            f"Desplazamiento ({e.tx}, {e.ty}) mm"
+        )
+
+
+def _edit_matrix(e: EditState) -> np.ndarray:
+    """Afín 2x3 de la edición: M = T(tx, ty) @ R(rot) @ S(scale)"""
+    theta = np.deg2rad(e.rot)
+    c, s = np.cos(theta), np.sin(theta)
+    return np.array([[c*e.scale, -s*e.scale, e.tx],
+                     [s*e.scale,  c*e.scale, e.ty]])
+
+
+def geometries_to_arrays(geometries) -> Tuple[np.ndarray, np.ndarray]:
+    """Convertir geometrías a (xy, starts) (sin Qt: se ejecuta en el worker).
+
+    xy es (N, 2) float64 sin separadores y starts (M+1,) int64 con los
+    desplazamientos de cada trayectoria: la k-ésima es xy[starts[k]:starts[k+1]].
+    """
+    geoms = np.asarray(geometries, dtype=object)
+    # Todos los vértices en una sola llamada a GEOS
+    xy, idx = shapely.get_coordinates(geoms, return_index=True)
+    starts = np.searchsorted(idx, np.arange(len(geoms) + 1)).astype(np.int64)
+    return xy, starts
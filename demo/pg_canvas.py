@@ -0,0 +1,107 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtCore import QTimer
+import numpy as np
+import pyqtgraph as pg
+import time
+
+from app.ui.canvas import CanvasView
+from . import SAMPLE_HZ, with_breaks
+
+_pg_configured = False
+
+
+def _configure_pyqtgraph() -> None:
+    """Opciones globales de pyqtgraph, una vez por proceso (necesita QApplication).
+
+    Rasterizado de las curvas en GPU sólo si se puede crear un contexto GL,
+    con la misma comprobación que CanvasView.
+    """
+    global _pg_configured
+    if not _pg_configured:
+        pg.setConfigOptions(useOpenGL=CanvasView._opengl_available(), antialias=True)
+        _pg_configured = True
+
+
+class PgCanvasWidget(QWidget):
+    """Canvas con la misma interfaz que CanvasWidget, dibujado con pyqtgraph.
+
+    Sin el árbol de artistas de matplotlib cada frame es un setData, lo que
+    permite animar la simulación a ~60 fps.
+    """
+
+    # Mismo ritmo de muestras que CanvasWidget; el timer sólo fija el refresco
+    SAMPLE_HZ = SAMPLE_HZ
+    
+    def __init__(self):
+        super().__init__()
+        self.simulation_timer = QTimer(self)
+        self.simulation_timer.setInterval(16)
+        self.simulation_timer.timeout.connect(self._update_simulation)
+        self.edit_curve = None
+        self.sim_x = self.sim_y = np.empty(0)
+        self.current_index = 0
+        self._sim_t0 = 0.0
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        _configure_pyqtgraph()
+        self.plot = pg.PlotWidget(title="Robot Cortador - Visualización de Trayectorias")
+        self.plot.setAspectLocked(True)
+        self.plot.showGrid(x=True, y=True, alpha=0.3)
+        self.plot.setLabel('bottom', "X [mm]")
+        self.plot.setLabel('left', "Y [mm]")
+        layout.addWidget(self.plot)
+
+    def _reset(self):
+        self.simulation_timer.stop()
+        self.plot.clear()
+        self.edit_curve = None
+
+    def plot_geometries(self, geometries):
+        """Dibujar geometrías en el canvas"""
+        self._reset()
+        for geom in geometries:
+            xy = np.asarray(geom.coords)
+            self.plot.plot(xy[:, 0], xy[:, 1], pen=pg.mkPen(width=2))
+
+    def update_arrays(self, xy: np.ndarray, starts: np.ndarray):
+        """Redibujar las trayectorias editadas (trayectoria k = xy[starts[k]:starts[k+1]])"""
+        xy = with_breaks(xy, starts)
+        if self.edit_curve is None:
+            self._reset()
+            self.edit_curve = self.plot.plot(pen=pg.mkPen(width=2))
+        self.edit_curve.setData(xy[:, 0], xy[:, 1], connect='finite')
+
+    def start_simulation(self, xy: np.ndarray, starts: np.ndarray):
+        """Iniciar simulación animada (trayectoria k = xy[starts[k]:starts[k+1]])"""
+        self._reset()
+
+        # Todas las trayectorias de fondo en una sola curva
+        path = with_breaks(xy, starts)
+        self.sim_curve = self.plot.plot(path[:, 0], path[:, 1],
+                                        pen=pg.mkPen('b', width=1), connect='finite')
+
+        # Punto para animación
+        self.sim_scatter = pg.ScatterPlotItem(size=6, brush='r')
+        self.plot.addItem(self.sim_scatter)
+
+        self.sim_x = np.ascontiguousarray(xy[:, 0], dtype=np.float64)
+        self.sim_y = np.ascontiguousarray(xy[:, 1], dtype=np.float64)
+        self.current_index = -1
+        self._sim_t0 = time.monotonic()
+        self.simulation_timer.start()
+
+    def _update_simulation(self):
+        """Actualizar frame de simulación: la muestra sale del tiempo transcurrido"""
+        n = len(self.sim_x)
+        i = min(int((time.monotonic() - self._sim_t0) * self.SAMPLE_HZ), n - 1)
+        if i != self.current_index:
+            self.sim_scatter.setData(x=self.sim_x[i:i+1], y=self.sim_y[i:i+1])
+            self.current_index = i
+        if i >= n - 1:
+            self.simulation_timer.stop()
+
+    def clear(self):
+        """Limpiar el canvas"""
+        self._reset()
@@ -3,8 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QPainter, QPixmap
 from PyQt6.QtWidgets import (QButtonGroup, QFrame, QToolButton, QVBoxLayout, 
                             QSizePolicy, QLabel, QProgressBar, QGroupBox,
                             QDoubleSpinBox, QCheckBox, QComboBox, QScrollArea)
@@ -12,12 +12,59 @@ from PyQt6.QtWidgets import (QButtonGroup, QFrame, QToolButton, QVBoxLayout,
 from PyQt6.QtWidgets import QWidget
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SidebarAction:
     text: str
     icon: QIcon | None = None
     enabled: bool = True
 
+# Emojis rasterizados una sola vez: evita buscar la fuente de respaldo en cada repintado
+_EMOJI_ICONS: dict[str, QIcon] = {}
+
+
+def _render_emoji_icon(char: str, size: int = 24) -> QIcon:
+    """Render an emoji into a cached QIcon."""
+    icon = _EMOJI_ICONS.get(char)
+    if icon is None:
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setPixelSize(int(size * 0.8))
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, char)
+        painter.end()
+        icon = _EMOJI_ICONS[char] = QIcon(pixmap)
+    return icon
+
+
+@dataclass(slots=True, frozen=True)
+class EditState:
+    """Estado completo de la edición de forma, emitido en una sola señal"""
+    scale: float = 1.0
+    tx: float = 0.0
+    ty: float = 0.0
+    rot: float = 0.0
+    side: str = "Exterior"
+
+
+class _Debouncer(QObject):
+    """Coalesce bursts of signals into a single deferred callback."""
+
+    def __init__(self, callback, interval: int = 50, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(callback)
+
+    def push(self, *_args) -> None:
+        self._timer.start()
+
+    def cancel(self) -> None:
+        self._timer.stop()
+
+
 class Sidebar(QFrame):
     """Vertical action bar combining simple design with full workspace sections."""
     
@@ -30,10 +77,7 @@ class Sidebar(QFrame):
     configRequested = pyqtSignal()
     
     # Señales de edición (workspace completo)
-    scaleChanged = pyqtSignal(float)
-    moveXChanged = pyqtSignal(float)
-    moveYChanged = pyqtSignal(float)
-    relationChanged = pyqtSignal(float)
+    editChanged = pyqtSignal(object)   # EditState
     saveRequested = pyqtSignal()
     clearRequested = pyqtSignal()
     p2pRequested = pyqtSignal()
@@ -62,6 +106,10 @@ class Sidebar(QFrame):
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(self.scroll_area)
         
+        # Secciones colapsadas: su contenido se construye al expandirlas
+        self._lazy_sections = {}
+        self._files_text = "No hay archivos cargados"
+        
         self._build_header_section()
         self._build_main_actions_section()  # Tu diseño simple
         self._build_workspace_section()     # Sección workspace completa
@@ -74,15 +122,7 @@ class Sidebar(QFrame):
         """Header with robot title"""
         header = QLabel("ROBOT CORTADOR")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setStyleSheet("""
-            font-weight: bold; 
-            font-size: 16px; 
-            padding: 15px; 
-            color: #5aa4db;
-            background-color: #2a2a2a;
-            border-radius: 8px;
-            margin: 5px;
-        """)
+        header.setObjectName("sidebarHeader")
         header.setMinimumHeight(50)
         self._layout.addWidget(header)
 
@@ -117,26 +157,29 @@ class Sidebar(QFrame):
         self.workspace_group.setCheckable(True)
         self.workspace_group.setChecked(False)  # Colapsado por defecto
         self.workspace_group.toggled.connect(self._on_workspace_toggled)
-        
-        layout = QVBoxLayout(self.workspace_group)
-        
+        QVBoxLayout(self.workspace_group)
+        self._add_lazy_section(self.workspace_group, self._populate_workspace_section)
+        self._layout.addWidget(self.workspace_group)
+
+    def _populate_workspace_section(self, layout: QVBoxLayout):
+        """Contenido del workspace, creado al expandirlo por primera vez"""
         # Files info
         files_label = QLabel("ARCHIVOS")
-        files_label.setStyleSheet("font-weight: bold; color: #5aa4db; font-size: 12px;")
+        files_label.setObjectName("sectionLabel")
         layout.addWidget(files_label)
         
-        self.files_info = QLabel("No hay archivos cargados")
-        self.files_info.setStyleSheet("font-size: 11px; color: #cccccc;")
+        self.files_info = QLabel(self._files_text)
+        self.files_info.setObjectName("infoLabel")
         layout.addWidget(self.files_info)
         
         # Dimensions
         dims_label = QLabel("Material: 25 mm\nOrigen: centro (0, 0)")
-        dims_label.setStyleSheet("font-size: 11px; color: #cccccc;")
+        dims_label.setObjectName("infoLabel")
         layout.addWidget(dims_label)
         
         # Navigation info
         nav_label = QLabel("Rueda = zoom | Click medio = pan")
-        nav_label.setStyleSheet("font-size: 10px; color: #888888; font-style: italic;")
+        nav_label.setObjectName("hintLabel")
         layout.addWidget(nav_label)
         
         # Quick actions
@@ -156,32 +199,36 @@ class Sidebar(QFrame):
         quick_layout.addWidget(self.p2p_btn)
         
         layout.addLayout(quick_layout)
-        self._layout.addWidget(self.workspace_group)
 
     def _build_edit_section(self):
         """Edit section - collapsed by default"""
         self.edit_group = QGroupBox("EDITAR FORMA ▸")
         self.edit_group.setCheckable(True)
         self.edit_group.setChecked(False)
-        
-        layout = QVBoxLayout(self.edit_group)
+        QVBoxLayout(self.edit_group)
+        self._add_lazy_section(self.edit_group, self._populate_edit_section)
+        self._layout.addWidget(self.edit_group)
+
+    def _populate_edit_section(self, layout: QVBoxLayout):
+        """Controles de edición, creados al expandir la sección"""
+        self._edit_debouncer = _Debouncer(self._emit_edit_state, parent=self)
         
         # Side/Inside selection
         side_layout = QVBoxLayout()
         side_label = QLabel("Lado de Corte")
-        side_label.setStyleSheet("font-weight: bold; font-size: 11px;")
+        side_label.setObjectName("fieldLabel")
         side_layout.addWidget(side_label)
         
         self.side_combo = QComboBox()
         self.side_combo.addItems(["Exterior", "Interior"])
-        self.side_combo.setStyleSheet("font-size: 11px;")
+        self.side_combo.currentTextChanged.connect(self._edit_debouncer.push)
         side_layout.addWidget(self.side_combo)
         layout.addLayout(side_layout)
         
         # Rotation
         rotation_layout = QVBoxLayout()
         rotation_label = QLabel("Rotación (°)")
-        rotation_label.setStyleSheet("font-weight: bold; font-size: 11px;")
+        rotation_label.setObjectName("fieldLabel")
         rotation_layout.addWidget(rotation_label)
         
         self.rotation_spin = QDoubleSpinBox()
@@ -189,15 +236,14 @@ class Sidebar(QFrame):
         self.rotation_spin.setValue(0.0)
         self.rotation_spin.setDecimals(2)
         self.rotation_spin.setSingleStep(5.0)
-        self.rotation_spin.valueChanged.connect(self.relationChanged.emit)
-        self.rotation_spin.setStyleSheet("font-size: 11px;")
+        self.rotation_spin.valueChanged.connect(self._edit_debouncer.push)
         rotation_layout.addWidget(self.rotation_spin)
         layout.addLayout(rotation_layout)
         
         # Scale
         scale_layout = QVBoxLayout()
         scale_label = QLabel("Escala")
-        scale_label.setStyleSheet("font-weight: bold; font-size: 11px;")
+        scale_label.setObjectName("fieldLabel")
         scale_layout.addWidget(scale_label)
         
         self.scale_spin = QDoubleSpinBox()
@@ -205,15 +251,14 @@ class Sidebar(QFrame):
         self.scale_spin.setValue(1.0)
         self.scale_spin.setSingleStep(0.1)
         self.scale_spin.setDecimals(2)
-        self.scale_spin.valueChanged.connect(self.scaleChanged.emit)
-        self.scale_spin.setStyleSheet("font-size: 11px;")
+        self.scale_spin.valueChanged.connect(self._edit_debouncer.push)
         scale_layout.addWidget(self.scale_spin)
         layout.addLayout(scale_layout)
         
         # Move controls
         move_layout = QVBoxLayout()
         move_label = QLabel("Desplazamiento (mm)")
-        move_label.setStyleSheet("font-weight: bold; font-size: 11px;")
+        move_label.setObjectName("fieldLabel")
         move_layout.addWidget(move_label)
         
         # X Move
@@ -224,8 +269,7 @@ class Sidebar(QFrame):
         self.x_move_spin.setValue(0.0)
         self.x_move_spin.setDecimals(2)
         self.x_move_spin.setSingleStep(1.0)
-        self.x_move_spin.valueChanged.connect(self.moveXChanged.emit)
-        self.x_move_spin.setStyleSheet("font-size: 11px;")
+        self.x_move_spin.valueChanged.connect(self._edit_debouncer.push)
         x_layout.addWidget(x_label)
         x_layout.addWidget(self.x_move_spin)
         
@@ -237,8 +281,7 @@ class Sidebar(QFrame):
         self.y_move_spin.setValue(0.0)
         self.y_move_spin.setDecimals(2)
         self.y_move_spin.setSingleStep(1.0)
-        self.y_move_spin.valueChanged.connect(self.moveYChanged.emit)
-        self.y_move_spin.setStyleSheet("font-size: 11px;")
+        self.y_move_spin.valueChanged.connect(self._edit_debouncer.push)
         y_layout.addWidget(y_label)
         y_layout.addWidget(self.y_move_spin)
         
@@ -248,17 +291,18 @@ class Sidebar(QFrame):
         xy_main_layout.addLayout(y_layout)
         move_layout.addLayout(xy_main_layout)
         layout.addLayout(move_layout)
-        
-        self._layout.addWidget(self.edit_group)
 
     def _build_help_section(self):
         """Help section - collapsed by default"""
         self.help_group = QGroupBox("HERRAMIENTAS ▸")
         self.help_group.setCheckable(True)
         self.help_group.setChecked(False)
-        
-        layout = QVBoxLayout(self.help_group)
-        
+        QVBoxLayout(self.help_group)
+        self._add_lazy_section(self.help_group, self._populate_help_section)
+        self._layout.addWidget(self.help_group)
+
+    def _populate_help_section(self, layout: QVBoxLayout):
+        """Botones de herramientas, creados al expandir la sección"""
         help_actions = [
             ("Diseño", "🎨"),
             ("Patrones", "🔁"), 
@@ -274,82 +318,60 @@ class Sidebar(QFrame):
             if text == "Ejecutar":
                 btn.clicked.connect(self.runRequested.emit)
             layout.addWidget(btn)
-        
-        self._layout.addWidget(self.help_group)
+
+    def _add_lazy_section(self, group: QGroupBox, populate):
+        """Difiere la creación del contenido de un grupo hasta que se expanda"""
+        self._lazy_sections[group] = populate
+        group.toggled.connect(lambda checked, g=group: checked and self._build_lazy_section(g))
+
+    def _build_lazy_section(self, group: QGroupBox):
+        populate = self._lazy_sections.pop(group, None)
+        if populate is not None:
+            populate(group.layout())
 
     def _create_main_button(self, text: str, icon: str) -> QToolButton:
         """Create main action button"""
         button = QToolButton()
         button.setText(text)
+        button.setIcon(_render_emoji_icon(icon))
         button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         button.setMinimumSize(200, 50)
         button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        button.setStyleSheet(f"""
-            QToolButton {{
-                background-color: #2a2a2a;
-                border: 2px solid #245983;
-                border-radius: 8px;
-                padding: 12px 15px;
-                color: #d8dce2;
-                font-weight: bold;
-                font-size: 13px;
-                margin: 3px;
-            }}
-            QToolButton:hover {{
-                background-color: rgba(47,107,165,0.3);
-                border-color: #5aa4db;
-            }}
-            QToolButton:pressed {{
-                background-color: #2f6ba5;
-                color: white;
-            }}
-        """)
+        button.setObjectName("mainBtn")
         return button
 
     def _create_small_button(self, text: str, icon: str) -> QToolButton:
         """Create small action button"""
         button = QToolButton()
         button.setText(text)
+        button.setIcon(_render_emoji_icon(icon))
+        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         button.setMinimumSize(120, 30)
         button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        button.setStyleSheet("""
-            QToolButton {
-                background-color: #2a2a2a;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: #cccccc;
-                font-size: 10px;
-            }
-            QToolButton:hover {
-                background-color: #3a3a3a;
-                border-color: #5aa4db;
-            }
-        """)
+        button.setObjectName("smallBtn")
         return button
 
     def _create_help_button(self, text: str, icon: str) -> QToolButton:
         """Create help section button"""
         button = QToolButton()
         button.setText(text)
+        button.setIcon(_render_emoji_icon(icon))
+        button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         button.setMinimumSize(120, 28)
         button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        button.setStyleSheet("""
-            QToolButton {
-                background-color: #2a2a2a;
-                border: 1px solid #444;
-                border-radius: 4px;
-                padding: 4px 8px;
-                text-align: left;
-                color: #cccccc;
-                font-size: 10px;
-            }
-            QToolButton:hover {
-                background-color: #3a3a3a;
-            }
-        """)
+        button.setObjectName("helpBtn")
         return button
 
+    def _emit_edit_state(self):
+        """Emitir todo el estado de edición de una vez"""
+        self.editChanged.emit(EditState(
+            scale=self.scale_spin.value(),
+            tx=self.x_move_spin.value(),
+            ty=self.y_move_spin.value(),
+            rot=self.rotation_spin.value(),
+            side=self.side_combo.currentText(),
+        ))
+
     def _on_workspace_toggled(self, checked: bool):
         """Update group title when toggled"""
         self.workspace_group.setTitle("WORKSPACE ▸" if not checked else "WORKSPACE ▾")
@@ -387,10 +409,73 @@ class Sidebar(QFrame):
                 padding: 4px;
                 color: white;
                 min-height: 25px;
+                font-size: 11px;
             }
             QDoubleSpinBox:focus, QComboBox:focus {
                 border-color: #5aa4db;
             }
+            #sidebarHeader {
+                font-weight: bold;
+                font-size: 16px;
+                padding: 15px;
+                color: #5aa4db;
+                background-color: #2a2a2a;
+                border-radius: 8px;
+                margin: 5px;
+            }
+            QLabel#sectionLabel {
+                font-weight: bold;
+                color: #5aa4db;
+                font-size: 12px;
+            }
+            QLabel#infoLabel {
+                font-size: 11px;
+                color: #cccccc;
+            }
+            QLabel#hintLabel {
+                font-size: 10px;
+                color: #888888;
+                font-style: italic;
+            }
+            QLabel#fieldLabel {
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QToolButton#mainBtn {
+                background-color: #2a2a2a;
+                border: 2px solid #245983;
+                border-radius: 8px;
+                padding: 12px 15px;
+                color: #d8dce2;
+                font-weight: bold;
+                font-size: 13px;
+                margin: 3px;
+            }
+            QToolButton#mainBtn:hover {
+                background-color: rgba(47,107,165,0.3);
+                border-color: #5aa4db;
+            }
+            QToolButton#mainBtn:pressed {
+                background-color: #2f6ba5;
+                color: white;
+            }
+            QToolButton#smallBtn, QToolButton#helpBtn {
+                background-color: #2a2a2a;
+                border: 1px solid #444;
+                border-radius: 4px;
+                padding: 4px 8px;
+                color: #cccccc;
+                font-size: 10px;
+            }
+            QToolButton#helpBtn {
+                text-align: left;
+            }
+            QToolButton#smallBtn:hover, QToolButton#helpBtn:hover {
+                background-color: #3a3a3a;
+            }
+            QToolButton#smallBtn:hover {
+                border-color: #5aa4db;
+            }
         """)
 
     # Métodos públicos para controlar el estado
@@ -401,10 +486,33 @@ class Sidebar(QFrame):
 
     def update_files_info(self, info: str):
         """Actualizar información de archivos"""
-        self.files_info.setText(info)
+        self._files_text = info
+        if self.workspace_group not in self._lazy_sections:
+            self.files_info.setText(info)
+
+    def reset_edit(self):
+        """Volver los controles de edición a EditState() sin emitir editChanged"""
+        if self.edit_group in self._lazy_sections:
+            return
+        # Un cambio pendiente del debouncer volvería a aplicar la edición anterior
+        self._edit_debouncer.cancel()
+        default = EditState()
+        for widget, value in ((self.scale_spin, default.scale),
+                              (self.x_move_spin, default.tx),
+                              (self.y_move_spin, default.ty),
+                              (self.rotation_spin, default.rot)):
+            widget.blockSignals(True)
+            widget.setValue(value)
+            widget.blockSignals(False)
+        self.side_combo.blockSignals(True)
+        self.side_combo.setCurrentText(default.side)
+        self.side_combo.blockSignals(False)
 
     def get_edit_parameters(self) -> dict:
         """Obtener parámetros de edición actuales"""
+        if self.edit_group in self._lazy_sections:
+            return {'side': 'Exterior', 'rotation': 0.0, 'scale': 1.0,
+                    'move_x': 0.0, 'move_y': 0.0}
         return {
             'side': self.side_combo.currentText(),
             'rotation': self.rotation_spin.value(),
@@ -369,25 +369,22 @@ class CanvasWidget(QWidget):
             
         self.setup_plot()
         
-        # Preparar datos para simulación
+        # Preparar datos para simulación (una sola máscara)
         path_points = trajectory_df[trajectory_df['point_type'] == 'path']
         self.sim_data = list(zip(path_points['x'], path_points['y']))
         
         if not self.sim_data:
             return
             
-        # Dibujar todas las trayectorias de fondo
-        colors = plt.cm.viridis(np.linspace(0, 1, len(trajectory_df['trajectory_id'].unique())))
-        
-        for i, traj_id in enumerate(trajectory_df['trajectory_id'].unique()):
-            traj_data = trajectory_df[
-                (trajectory_df['trajectory_id'] == traj_id) & 
-                (trajectory_df['point_type'] == 'path')
-            ]
-            if not traj_data.empty:
-                self.ax.plot(traj_data['x'], traj_data['y'], 
-                           color=colors[i], alpha=0.3, linewidth=2, 
-                           label=f"_Trayectoria {traj_id+1}")
+        # Dibujar todas las trayectorias de fondo: un solo groupby en vez de
+        # una máscara sobre todo el DataFrame por trayectoria
+        groups = path_points.groupby('trajectory_id', sort=False)
+        colors = plt.cm.viridis(np.linspace(0, 1, groups.ngroups))
+        
+        for i, (traj_id, traj_data) in enumerate(groups):
+            self.ax.plot(traj_data['x'].values, traj_data['y'].values, 
+                       color=colors[i], alpha=0.3, linewidth=2, 
+                       label=f"_Trayectoria {traj_id+1}")
         
         # Elementos de simulación
         self.sim_point, = self.ax.plot([], [], 'o', 
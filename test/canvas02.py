@@ -5,8 +5,10 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
 import pandas as pd
 import numpy as np
+import time
 
 class ModernNavigationToolbar(NavigationToolbar):
     """Toolbar personalizada con estilo moderno"""
@@ -46,17 +48,50 @@ class CanvasWidget(QWidget):
     simulationFinished = pyqtSignal()
     simulationProgress = pyqtSignal(int)
     
+    # Frames aproximados de una simulación completa
+    TARGET_FRAMES = 400
+    # Puntos máximos del rastro: el coste por frame no crece con la trayectoria
+    TRAIL_CAP = 2000
+    # Intervalo del timer (ms) con la ventana visible y minimizada
+    SIM_INTERVAL_MS = 25
+    HIDDEN_INTERVAL_MS = 500
+    # Periodo mínimo entre actualizaciones de coords_label (~10 Hz)
+    COORDS_PERIOD_NS = 100_000_000
+    
     def __init__(self):
         super().__init__()
         self.simulation_animation = None
         self.simulation_timer = QTimer()
         self.simulation_timer.timeout.connect(self._update_simulation)
         self.current_sim_index = 0
-        self.sim_data = []
+        # Puntos de la simulación como columnas contiguas (x, y)
+        self.sim_x = np.empty(0)
+        self.sim_y = np.empty(0)
+        self.points_per_frame = 1
+        self._last_progress = -1
+        # Sólo hay 101 textos de progreso posibles: se construyen una vez
+        self._progress_strings = [f"Progreso: {p}%" for p in range(101)]
+        self._last_coord_update = 0
+        # Buffers de un elemento para la cabeza de corte, reutilizados por frame
+        self._pt_x = np.empty(1)
+        self._pt_y = np.empty(1)
+        # Caché de puntos 'path' del último DataFrame (ver _path_data)
+        self._cached_df = None
+        self._path_df = None
+        self._traj_ids = np.empty(0, dtype=np.int32)
+        self._traj_starts = np.zeros(1, dtype=np.int64)
         self.is_simulating = False
+        self.sim_point = None
+        self.sim_trail = None
+        self._bg = None
+        # (línea, inicio, fin) por geometría, reutilizadas entre cargas
+        self._geom_lines = []
+        self._state_hooked = False
         
         self.setup_ui()
         self.setup_modern_plot_style()
+        # Fondo estático para blitting: se vuelve a capturar en cada dibujo completo
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
     def setup_ui(self):
         """Configurar la interfaz del canvas centrada"""
@@ -316,10 +351,11 @@ class CanvasWidget(QWidget):
         self.ax.spines['left'].set_color('#5aa4db')
         self.ax.spines['top'].set_visible(False)
         self.ax.spines['right'].set_visible(False)
+        
+        self._static_setup_plot()
     
-    def setup_plot(self):
-        """Configurar el gráfico base con estilo moderno y centrado"""
-        self.ax.clear()
+    def _static_setup_plot(self):
+        """Decoración fija del gráfico (una sola vez): títulos, grid, ejes y origen"""
         self.ax.set_facecolor('#2d2d2d')
         
         # Títulos y etiquetas con estilo moderno - CENTRADOS
@@ -327,21 +363,13 @@ class CanvasWidget(QWidget):
                          color='#5aa4db', fontsize=14, fontweight='bold', pad=20)
         self.ax.set_xlabel("Coordenada X [mm]", color='#bdc3c7', fontsize=11, labelpad=10)
         self.ax.set_ylabel("Coordenada Y [mm]", color='#bdc3c7', fontsize=11, labelpad=10)
-        
-        # Grid moderno
-        self.ax.grid(True, alpha=0.2, color='#5aa4db', linestyle='-', linewidth=0.5)
         self.ax.set_aspect('equal')
         
-        # Ejes con estilo
-        self.ax.tick_params(colors='#bdc3c7', labelsize=9)
-        self.ax.spines['bottom'].set_color('#5aa4db')
-        self.ax.spines['left'].set_color('#5aa4db')
-        self.ax.spines['top'].set_visible(False)
-        self.ax.spines['right'].set_visible(False)
-        
         # Líneas de referencia en el origen - MÁS VISIBLES
-        self.ax.axhline(y=0, color='#e74c3c', linestyle='--', alpha=0.6, linewidth=1.2)
-        self.ax.axvline(x=0, color='#e74c3c', linestyle='--', alpha=0.6, linewidth=1.2)
+        self._static_lines = (
+            self.ax.axhline(y=0, color='#e74c3c', linestyle='--', alpha=0.6, linewidth=1.2),
+            self.ax.axvline(x=0, color='#e74c3c', linestyle='--', alpha=0.6, linewidth=1.2),
+        )
         
         # Texto de origen mejorado
         self.ax.text(0.02, 0.98, 'ORIGEN (0,0)', transform=self.ax.transAxes, 
@@ -354,12 +382,35 @@ class CanvasWidget(QWidget):
         self.ax.set_xlim(-100, 100)
         self.ax.set_ylim(-100, 100)
     
+    def _reset_dynamic(self):
+        """Quitar sólo las líneas y la leyenda añadidas; la decoración fija se conserva"""
+        # Sin cabeza ni rastro no queda nada que animar
+        self.simulation_timer.stop()
+        self.is_simulating = False
+        for line in list(self.ax.lines):
+            if line not in self._static_lines:
+                line.remove()
+        for collection in list(self.ax.collections):
+            collection.remove()
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        self.sim_point = self.sim_trail = None
+        self._geom_lines = []
+        
+        # Asegurar que el gráfico esté centrado
+        self.ax.set_xlim(-100, 100)
+        self.ax.set_ylim(-100, 100)
+    
     def plot_geometries(self, geometries):
         """Dibujar geometrías en el canvas con estilo moderno"""
         if not geometries:
             return
             
-        self.setup_plot()
+        # Reutilizar las líneas de la carga anterior si siguen en los ejes;
+        # si no (p. ej. tras una simulación) se quitan los artistas dinámicos
+        if not self._geom_lines:
+            self._reset_dynamic()
         
         # Paleta de colores moderna
         colors = ['#5aa4db', '#e74c3c', '#27ae60', '#f39c12', '#9b59b6', '#1abc9c']
@@ -368,18 +419,35 @@ class CanvasWidget(QWidget):
             x, y = geom.xy
             color = colors[i % len(colors)]
             
+            if i < len(self._geom_lines):
+                line, start, end = self._geom_lines[i]
+                line.set_data(x, y)
+                line.set_label(f"Trayectoria {i+1}")
+                start.set_data([x[0]], [y[0]])
+                end.set_data([x[-1]], [y[-1]])
+                for artist in (line, start, end):
+                    artist.set_visible(True)
+                continue
+            
             # Línea principal
             line = self.ax.plot(x, y, linewidth=2.5, color=color, 
                                label=f"Trayectoria {i+1}", alpha=0.9,
                                marker='o', markersize=4, markevery=8)[0]
             
             # Puntos de inicio/fin destacados
-            self.ax.plot(x[0], y[0], 'o', markersize=10, color=color, 
-                        markeredgecolor='white', markeredgewidth=2,
-                        label=f'_Inicio {i+1}' if i == 0 else "")
-            self.ax.plot(x[-1], y[-1], 's', markersize=10, color=color,
-                        markeredgecolor='white', markeredgewidth=2,
-                        label=f'_Fin {i+1}' if i == 0 else "")
+            start = self.ax.plot(x[0], y[0], 'o', markersize=10, color=color, 
+                                markeredgecolor='white', markeredgewidth=2,
+                                label=f'_Inicio {i+1}' if i == 0 else "")[0]
+            end = self.ax.plot(x[-1], y[-1], 's', markersize=10, color=color,
+                              markeredgecolor='white', markeredgewidth=2,
+                              label=f'_Fin {i+1}' if i == 0 else "")[0]
+            self._geom_lines.append((line, start, end))
+        
+        # Las sobrantes se ocultan y quedan fuera de la leyenda
+        for line, start, end in self._geom_lines[len(geometries):]:
+            line.set_label("_oculta")
+            for artist in (line, start, end):
+                artist.set_visible(False)
         
         # Leyenda moderna y centrada
         legend = self.ax.legend(loc='upper right', framealpha=0.95, 
@@ -388,73 +456,73 @@ class CanvasWidget(QWidget):
                                bbox_to_anchor=(0.98, 0.98))
         legend.get_frame().set_linewidth(1.5)
         
-        # Ajustar límites con margen para mejor visualización
-        all_x = []
-        all_y = []
-        for geom in geometries:
-            x, y = geom.xy
-            all_x.extend(x)
-            all_y.extend(y)
-        
-        if all_x and all_y:
-            x_margin = (max(all_x) - min(all_x)) * 0.15
-            y_margin = (max(all_y) - min(all_y)) * 0.15
-            self.ax.set_xlim(min(all_x) - x_margin, max(all_x) + x_margin)
-            self.ax.set_ylim(min(all_y) - y_margin, max(all_y) + y_margin)
-        
-        self.canvas.draw()
+        # Ajustar límites con margen: extremos por geometría (bounds) y luego
+        # una reducción sobre ese array pequeño, sin juntar todos los puntos
+        bounds = np.array([geom.bounds for geom in geometries])
+        xmin, ymin = bounds[:, :2].min(axis=0)
+        xmax, ymax = bounds[:, 2:].max(axis=0)
+        x_margin = (xmax - xmin) * 0.15
+        y_margin = (ymax - ymin) * 0.15
+        self.ax.set_xlim(xmin - x_margin, xmax + x_margin)
+        self.ax.set_ylim(ymin - y_margin, ymax + y_margin)
+        self.ax.set_autoscale_on(False)
+        
+        self.canvas.draw_idle()
         self.status_label.setText(f"✅ {len(geometries)} trayectorias cargadas y centradas")
         self.sim_btn.setEnabled(True)
         
         # Actualizar información de coordenadas
-        if all_x and all_y:
-            self.coords_label.setText(f"X: [{min(all_x):.1f} : {max(all_x):.1f}] | Y: [{min(all_y):.1f} : {max(all_y):.1f}]")
+        self.coords_label.setText(f"X: [{xmin:.1f} : {xmax:.1f}] | Y: [{ymin:.1f} : {ymax:.1f}]")
     
     def start_simulation(self, trajectory_df: pd.DataFrame):
         """Iniciar simulación animada con estilo moderno"""
         if trajectory_df is None or trajectory_df.empty:
             return
             
-        self.setup_plot()
+        self._reset_dynamic()
         
         # Preparar datos para simulación
-        path_points = trajectory_df[trajectory_df['point_type'] == 'path']
-        self.sim_data = list(zip(path_points['x'], path_points['y']))
+        path_points, traj_ids, starts = self._path_data(trajectory_df)
+        self.sim_x = path_points['x'].to_numpy(dtype=np.float64)
+        self.sim_y = path_points['y'].to_numpy(dtype=np.float64)
         
-        if not self.sim_data:
+        if not len(self.sim_x):
             return
             
         # Dibujar todas las trayectorias de fondo
-        colors = plt.cm.viridis(np.linspace(0, 1, len(trajectory_df['trajectory_id'].unique())))
-        
-        for i, traj_id in enumerate(trajectory_df['trajectory_id'].unique()):
-            traj_data = trajectory_df[
-                (trajectory_df['trajectory_id'] == traj_id) & 
-                (trajectory_df['point_type'] == 'path')
-            ]
-            if not traj_data.empty:
-                self.ax.plot(traj_data['x'], traj_data['y'], 
-                           color=colors[i], alpha=0.4, linewidth=2.5, 
-                           label=f"_Trayectoria {traj_id+1}")
+        colors = plt.cm.viridis(np.linspace(0, 1, len(traj_ids)))
+        
+        # Cada trayectoria es un tramo contiguo: sim_x[starts[k]:starts[k+1]];
+        # todas van en una sola LineCollection (un artista, un dibujo)
+        xy = np.column_stack([self.sim_x, self.sim_y])
+        segments = [xy[a:b] for a, b in zip(starts[:-1], starts[1:])]
+        self.ax.add_collection(LineCollection(segments, colors=colors, alpha=0.4,
+                                              linewidths=2.5, label="_Trayectorias"))
         
         # Elementos de simulación
         self.sim_point, = self.ax.plot([], [], 'o', 
                                      markersize=14, color='#e74c3c',
                                      markeredgecolor='white', 
                                      markeredgewidth=2.5,
-                                     label='Cabeza de Corte')
+                                     label='Cabeza de Corte', animated=True)
         
         # Rastro de la simulación
         self.sim_trail, = self.ax.plot([], [], '-', 
-                                     color='#f39c12', alpha=0.7, linewidth=2.0)
+                                     color='#f39c12', alpha=0.7, linewidth=2.0,
+                                     animated=True)
         
         # Leyenda centrada
         legend = self.ax.legend(loc='upper right', framealpha=0.95)
         legend.get_frame().set_facecolor('#2d2d2d')
         
+        # Dibujo completo una sola vez; _on_draw guarda el fondo sin los artistas animados
+        self.canvas.draw()
+        
         # Iniciar simulación
         self.current_sim_index = 0
-        self.trail_x, self.trail_y = [], []
+        self._last_progress = -1
+        # Avanzar varios puntos por tick: cualquier trayectoria dura ~400 frames
+        self.points_per_frame = max(1, len(self.sim_x) // self.TARGET_FRAMES)
         self.is_simulating = True
         
         self.sim_btn.setText("⏸ Pausar")
@@ -462,37 +530,92 @@ class CanvasWidget(QWidget):
         self.stop_btn.setEnabled(True)
         self.status_label.setText("🎬 Simulación en progreso...")
         
-        # Usar QTimer para mejor control
-        self.simulation_timer.start(25)  # 25ms entre frames para mayor suavidad
+        # Usar QTimer para mejor control (más lento si la ventana está minimizada)
+        self.simulation_timer.start(self._sim_interval())
         
         self.simulationStarted.emit()
     
     def _update_simulation(self):
         """Actualizar frame de simulación"""
-        if self.current_sim_index < len(self.sim_data):
-            x, y = self.sim_data[self.current_sim_index]
+        n = len(self.sim_x)
+        if self.current_sim_index < n:
+            i = min(self.current_sim_index + self.points_per_frame, n) - 1
+            x, y = self.sim_x[i], self.sim_y[i]
             
             # Actualizar punto de simulación
-            self.sim_point.set_data([x], [y])
+            self._pt_x[0], self._pt_y[0] = x, y
+            self.sim_point.set_data(self._pt_x, self._pt_y)
             
-            # Actualizar rastro
-            self.trail_x.append(x)
-            self.trail_y.append(y)
-            self.sim_trail.set_data(self.trail_x, self.trail_y)
+            # Rastro = últimos TRAIL_CAP puntos recorridos: vistas sobre los arrays,
+            # sin copiar ni buffer circular
+            t0 = max(0, i + 1 - self.TRAIL_CAP)
+            self.sim_trail.set_data(self.sim_x[t0:i + 1], self.sim_y[t0:i + 1])
             
-            # Actualizar coordenadas en tiempo real
-            self.coords_label.setText(f"X: {x:.1f} | Y: {y:.1f}")
+            # Coordenadas a ~10 Hz: más rápido no se lee y cada setText repinta el QLabel
+            now = time.monotonic_ns()
+            if now - self._last_coord_update > self.COORDS_PERIOD_NS:
+                self.coords_label.setText(f"X: {x:.1f} | Y: {y:.1f}")
+                self._last_coord_update = now
             
             # Actualizar progreso
-            progress = int((self.current_sim_index + 1) / len(self.sim_data) * 100)
-            self.progress_label.setText(f"Progreso: {progress}%")
-            self.simulationProgress.emit(progress)
+            progress = int((i + 1) / n * 100)
+            if progress != self._last_progress:
+                self.progress_label.setText(self._progress_strings[progress])
+                self.simulationProgress.emit(progress)
+                self._last_progress = progress
             
-            self.current_sim_index += 1
-            self.canvas.draw()
+            self.current_sim_index = i + 1
+            # Si nadie ve el canvas se avanza el estado pero no se pinta
+            if self._canvas_visible():
+                self._blit()
         else:
             self.stop_simulation()
     
+    def _canvas_visible(self) -> bool:
+        return self.canvas.isVisible() and not self.window().isMinimized()
+    
+    def _sim_interval(self) -> int:
+        return self.HIDDEN_INTERVAL_MS if self.window().isMinimized() else self.SIM_INTERVAL_MS
+    
+    def showEvent(self, event):
+        """Engancha windowStateChanged de la ventana nativa (sólo existe tras mostrarse)"""
+        super().showEvent(event)
+        handle = self.window().windowHandle()
+        if not self._state_hooked and handle is not None:
+            handle.windowStateChanged.connect(self._on_window_state_changed)
+            self._state_hooked = True
+    
+    def _on_window_state_changed(self, state):
+        """Minimizada: el timer baja a HIDDEN_INTERVAL_MS para no gastar CPU"""
+        if self.simulation_timer.isActive():
+            self.simulation_timer.setInterval(self._sim_interval())
+    
+    def _on_draw(self, event):
+        """Tras cada dibujo completo (inicio, zoom, resize) se guarda el fondo.
+
+        El fondo es el bitmap Agg ya rasterizado de las trayectorias estáticas;
+        fuera de una simulación nadie lo usa y no se copia.
+        """
+        if self.sim_point is None or not self.sim_point.get_animated():
+            self._bg = None
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        for artist in (self.sim_trail, self.sim_point):
+            if artist is not None and artist.get_animated():
+                self.ax.draw_artist(artist)
+    
+    def _blit(self):
+        """Repintar sólo rastro y cabeza sobre el fondo guardado"""
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+    
     def toggle_simulation(self):
         """Alternar entre play/pause"""
         if self.is_simulating:
@@ -514,7 +637,13 @@ class CanvasWidget(QWidget):
         self.simulation_timer.stop()
         self.is_simulating = False
         self.current_sim_index = 0
-        self.trail_x, self.trail_y = [], []
+        self._last_progress = -1
+        
+        # El rastro final pasa a formar parte del dibujo normal
+        for artist in (self.sim_trail, self.sim_point):
+            if artist is not None:
+                artist.set_animated(False)
+        self.canvas.draw_idle()
         
         self.sim_btn.setText("▶ Iniciar Simulación")
         self.sim_btn.setEnabled(True)
@@ -527,7 +656,7 @@ class CanvasWidget(QWidget):
     
     def clear(self):
         """Limpiar el canvas"""
-        self.setup_plot()
+        self._reset_dynamic()
         self.canvas.draw()
         self.status_label.setText("🟢 Canvas limpiado - Listo para nueva carga")
         self.sim_btn.setEnabled(False)
@@ -538,13 +667,39 @@ class CanvasWidget(QWidget):
         # Limpiar datos de simulación
         if hasattr(self, 'trajectory_df'):
             del self.trajectory_df
+        self._cached_df = self._path_df = None
+        self._traj_ids = np.empty(0, dtype=np.int32)
+        self._traj_starts = np.zeros(1, dtype=np.int64)
     
     def set_trajectory_data(self, trajectory_df: pd.DataFrame):
         """Establecer datos de trayectoria para simulación"""
+        if trajectory_df is not None and not isinstance(trajectory_df['point_type'].dtype,
+                                                        pd.CategoricalDtype):
+            # Categórico + int32: los filtros comparan códigos, no strings
+            trajectory_df = trajectory_df.astype({'point_type': 'category',
+                                                  'trajectory_id': np.int32})
         self.trajectory_df = trajectory_df
         if trajectory_df is not None and not trajectory_df.empty:
+            self._path_data(trajectory_df)
             self.sim_btn.setEnabled(True)
     
+    def _path_data(self, trajectory_df: pd.DataFrame):
+        """Puntos 'path', ids y desplazamientos por trayectoria, una vez por DataFrame.
+
+        El DataFrame se construye en orden de trayectoria, así que cada una es
+        un tramo contiguo: basta con ubicar dónde cambia trajectory_id.
+        """
+        if trajectory_df is not self._cached_df:
+            path_df = trajectory_df[trajectory_df['point_type'] == 'path']
+            ids = path_df['trajectory_id'].to_numpy()
+            cuts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+            ends = [len(ids)] if len(ids) else []
+            self._traj_starts = np.concatenate(([0], cuts, ends)).astype(np.int64)
+            self._traj_ids = ids[self._traj_starts[:-1]]
+            self._path_df = path_df
+            self._cached_df = trajectory_df
+        return self._path_df, self._traj_ids, self._traj_starts
+    
     def update_status(self, message: str):
         """Actualizar mensaje de estado"""
         self.status_label.setText(message)
\ No newline at end of file
@@ -1,12 +1,15 @@
 import sys
 from PyQt6.QtWidgets import QApplication
 from .main_window01 import MainWindow
+from .sidebar01 import Sidebar
 
 def main():
     app = QApplication(sys.argv)
     
     # Configurar estilo de la aplicación
     app.setStyle('Fusion')
+    # La hoja del sidebar se parsea una vez para toda la aplicación
+    Sidebar.install_global_stylesheet(app)
     
     # Crear y mostrar ventana principal
     window = MainWindow()
@@ -2,19 +2,64 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                             QSplitter, QStatusBar, QMessageBox, QFileDialog)
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QIcon, QAction
+import numpy as np
 import pandas as pd
+import shapely
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
 from .sidebar01 import Sidebar, SidebarAction
 from .canvas01 import CanvasWidget
 from app.core.dxf_processor import DXFProcessor
+from app.core.dxf_worker import DXFWorker
+from app.core.transform import HAS_NUMBA, NUMBA_MIN_POINTS
+
+if HAS_NUMBA:
+    from numba import njit
+
+    @njit(cache=True)
+    def _flatten_kernel(xy, lengths, out_x, out_y, out_id, out_code):
+        # Una sola pasada: copia cada trayectoria y escribe su separador (NaN)
+        src = 0
+        dst = 0
+        for i in range(lengths.shape[0]):
+            for _ in range(lengths[i]):
+                out_x[dst] = xy[src, 0]
+                out_y[dst] = xy[src, 1]
+                out_id[dst] = i
+                src += 1
+                dst += 1
+            out_x[dst] = np.nan
+            out_y[dst] = np.nan
+            out_id[dst] = i
+            out_code[dst] = 1
+            dst += 1
+
+
+def _flatten(xy: np.ndarray, lengths: np.ndarray):
+    """(x, y, trajectory_id, point_code) con una fila separadora tras cada trayectoria"""
+    total = len(xy) + len(lengths)
+    point_code = np.zeros(total, dtype=np.int8)    # 0 = path, 1 = separator
+    if HAS_NUMBA and len(xy) >= NUMBA_MIN_POINTS:
+        x = np.empty(total)
+        y = np.empty(total)
+        ids = np.empty(total, dtype=np.int32)
+        _flatten_kernel(xy, lengths, x, y, ids, point_code)
+        return x, y, ids, point_code
+    
+    ends = np.cumsum(lengths)
+    xy = np.insert(xy, ends, np.nan, axis=0)
+    point_code[ends + np.arange(len(lengths))] = 1
+    ids = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths + 1)
+    return xy[:, 0], xy[:, 1], ids, point_code
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.dxf_processor = DXFProcessor()
         self.trajectory_df = None
+        self._path_df = None
+        self._dxf_worker = None
         self.setup_ui()
         self.setup_connections()
         
@@ -67,10 +112,20 @@ class MainWindow(QMainWindow):
         
     def setup_connections(self):
         """Conectar señales del sidebar"""
-        self.sidebar.loadDxfRequested.connect(self.load_dxf)
-        self.sidebar.generatePathRequested.connect(self.generate_trajectory)
-        self.sidebar.simulateRequested.connect(self.simulate_cutting)
-        self.sidebar.exportRequested.connect(self.export_trajectory)
+        # Una sola señal del sidebar; la acción se despacha por nombre
+        self._sidebar_handlers = {
+            "Cargar DXF": self.load_dxf,
+            "Generar Trayectoria": self.generate_trajectory,
+            "Simular Corte": self.simulate_cutting,
+            "Exportar": self.export_trajectory,
+        }
+        self.sidebar.actionTriggered.connect(self.on_sidebar_action)
+        
+    def on_sidebar_action(self, name: str):
+        """Ejecutar la acción del sidebar (las que no tienen handler se ignoran)"""
+        handler = self._sidebar_handlers.get(name)
+        if handler is not None:
+            handler()
         
     def load_dxf(self):
         """Cargar y procesar archivo DXF"""
@@ -81,59 +136,66 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage(f"Procesando {file_path}...")
             self.sidebar.show_progress(True)
             
-            # Procesar en background (simulado con QTimer)
-            QTimer.singleShot(100, lambda: self.process_dxf_file(file_path))
-            
-    def process_dxf_file(self, file_path: str):
-        """Procesar el archivo DXF"""
-        try:
-            success = self.dxf_processor.process_file(file_path)
+            # Procesar en background (QThreadPool): lectura del DXF y DataFrame;
+            # el resultado vuelve al hilo de la GUI por conexión en cola
+            self._dxf_worker = DXFWorker(
+                file_path, self.dxf_processor.tolerance,
+                postprocess=lambda p: self.geometries_to_dataframe(p.merged_geoms))
+            self._dxf_worker.signals.finished.connect(
+                self.on_dxf_processed, Qt.ConnectionType.QueuedConnection)
+            self._dxf_worker.signals.failed.connect(
+                self.on_dxf_failed, Qt.ConnectionType.QueuedConnection)
+            self._dxf_worker.start()
             
-            if success:
-                # Convertir a DataFrame
-                self.trajectory_df = self.geometries_to_dataframe()
-                
-                # Actualizar UI
-                self.canvas.plot_geometries(self.dxf_processor.merged_geoms)
-                self.sidebar.set_action_enabled("Generar Trayectoria", True)
-                self.status_bar.showMessage(f"✅ DXF cargado: {len(self.dxf_processor.merged_geoms)} trayectorias")
-                
-                # Mostrar estadísticas
-                stats = self.dxf_processor.get_statistics()
-                self.show_stats_message(stats)
-            else:
-                self.status_bar.showMessage("❌ Error procesando DXF")
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"No se pudo procesar el DXF:\n{str(e)}")
-            self.status_bar.showMessage("❌ Error cargando DXF")
-        finally:
-            self.sidebar.show_progress(False)
+    def on_dxf_processed(self, processor: DXFProcessor, trajectory_df: pd.DataFrame):
+        """Recibe el DXF procesado y su DataFrame desde el worker"""
+        if self._dxf_worker is None or self.sender() is not self._dxf_worker.signals:
+            return  # Resultado de una carga ya reemplazada por otra más reciente
+        self.dxf_processor = processor
+        self._dxf_worker = None
+        self.sidebar.show_progress(False)
+        
+        self.trajectory_df = trajectory_df
+        # Sólo puntos de trayectoria (sin separadores), filtrados una vez por carga
+        self._path_df = self.trajectory_df[self.trajectory_df['point_type'] == 'path']
+        
+        # Actualizar UI
+        self.canvas.plot_geometries(self.dxf_processor.merged_geoms)
+        self.sidebar.set_action_enabled("Generar Trayectoria", True)
+        self.status_bar.showMessage(f"✅ DXF cargado: {len(self.dxf_processor.merged_geoms)} trayectorias, "
+                                    f"{len(self._path_df)} puntos")
+        
+        # Mostrar estadísticas
+        stats = self.dxf_processor.get_statistics()
+        self.show_stats_message(stats)
+        
+    def on_dxf_failed(self, error: str):
+        """Error reportado por el worker"""
+        if self._dxf_worker is None or self.sender() is not self._dxf_worker.signals:
+            return  # Resultado de una carga ya reemplazada por otra más reciente
+        self._dxf_worker = None
+        self.sidebar.show_progress(False)
+        QMessageBox.critical(self, "Error", f"No se pudo procesar el DXF:\n{error}")
+        self.status_bar.showMessage("❌ Error cargando DXF")
             
-    def geometries_to_dataframe(self) -> pd.DataFrame:
-        """Convertir geometrías a DataFrame de puntos"""
-        points = []
-        
-        for i, geom in enumerate(self.dxf_processor.merged_geoms):
-            x, y = geom.xy
-            for xi, yi in zip(x, y):
-                points.append({
-                    'x': xi,
-                    'y': yi, 
-                    'trajectory_id': i,
-                    'point_type': 'path'
-                })
-            # Añadir separador entre trayectorias
-            points.append({
-                'x': None,
-                'y': None,
-                'trajectory_id': i,
-                'point_type': 'separator'
-            })
+    def geometries_to_dataframe(self, geometries) -> pd.DataFrame:
+        """Convertir geometrías a DataFrame de puntos (sin Qt: puede correr en el worker)"""
+        geoms = np.asarray(geometries, dtype=object)
+        # Todos los vértices en una sola llamada a GEOS, sin bucle en Python
+        xy, idx = shapely.get_coordinates(geoms, return_index=True)
+        lengths = np.bincount(idx, minlength=len(geoms))
+        
+        # Una fila separadora (NaN) al final de cada trayectoria
+        x, y, ids, point_code = _flatten(xy, lengths)
             
-        df = pd.DataFrame(points)
-        print(f"📊 DataFrame creado: {len(df)} puntos, {len(self.dxf_processor.merged_geoms)} trayectorias")
-        return df
+        points = {
+            'x': x,
+            'y': y,
+            'trajectory_id': ids,
+            # Categórico: los filtros `== 'path'` comparan códigos int8, no strings
+            'point_type': pd.Categorical.from_codes(point_code, categories=['path', 'separator'])
+        }
+        return pd.DataFrame(points)
     
     def generate_trajectory(self):
         """Generar trayectoria para el robot"""
@@ -159,13 +221,12 @@ class MainWindow(QMainWindow):
             
             if file_path:
                 try:
-                    # Filtrar solo puntos de trayectoria (no separadores)
-                    path_points = self.trajectory_df[self.trajectory_df['point_type'] == 'path']
-                    
-                    with open(file_path, 'w') as f:
-                        f.write("X,Y,Trajectory\n")
-                        for _, point in path_points.iterrows():
-                            f.write(f"{point['x']:.6f},{point['y']:.6f},{int(point['trajectory_id'])}\n")
+                    path_points = self._path_df
+                    data = np.column_stack([path_points['x'].to_numpy(),
+                                            path_points['y'].to_numpy(),
+                                            path_points['trajectory_id'].to_numpy()])
+                    np.savetxt(file_path, data, fmt=['%.6f', '%.6f', '%d'], delimiter=',',
+                               header='X,Y,Trajectory', comments='')
                     
                     self.status_bar.showMessage(f"✅ Trayectoria exportada: {file_path}")
                     QMessageBox.information(self, "Éxito", f"Trayectoria exportada:\n{file_path}")
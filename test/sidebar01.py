@@ -1,17 +1,56 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Iterable
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import (QButtonGroup, QFrame, QToolButton, QVBoxLayout, 
-                            QSizePolicy, QLabel, QProgressBar)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QColor, QIcon, QPalette
+from PyQt6.QtWidgets import (QFrame, QToolButton, QVBoxLayout, 
+                            QSizePolicy, QLabel, QProgressBar, QApplication)
 
 from PyQt6.QtCore import QSize
 
 
-@dataclass
+# Se parsea una sola vez por proceso si se instala en la QApplication
+# (Sidebar.install_global_stylesheet); si no, cada Sidebar la aplica
+_RAW_QSS = """
+#sidebar {
+    background-color: #1a1a1a;
+    color: #f0f0f0;
+    border-right: 1px solid #333;
+}
+#sidebar QToolButton {
+    border: 2px solid #245983;
+    padding: 8px 4px;
+    font-size: 11px;
+    background-color: transparent;
+    border-radius: 6px;
+    margin: 4px 6px;
+    font-weight: 500;
+    color: #d8dce2;
+}
+#sidebar QToolButton:hover {
+    background-color: rgba(47,107,165,0.3);
+}
+#sidebar QToolButton:checked {
+    background-color: #2f6ba5;
+    border-color: #5aa4db;
+    color: white;
+}
+#sidebar QToolButton:disabled {
+    border-color: #555;
+    color: #777;
+}
+"""
+# Versión compacta para el tokenizador de Qt (la hoja no tiene literales de texto)
+_QSS = (re.sub(r"\s+", " ", _RAW_QSS)
+        .replace(" {", "{").replace("{ ", "{").replace(" }", "}")
+        .replace(": ", ":").replace("; ", ";").strip())
+_global_qss_installed = False
+
+
+@dataclass(slots=True)
 class SidebarAction:
     text: str
     icon: QIcon | None = None
@@ -20,24 +59,30 @@ class SidebarAction:
 class Sidebar(QFrame):
     """Vertical action bar for robot cutter HMI."""
     
-    # Señales para las acciones del robot
+    # Única señal de acciones: quien la recibe filtra por nombre
     actionTriggered = pyqtSignal(str)
-    loadDxfRequested = pyqtSignal()
-    generatePathRequested = pyqtSignal()
-    simulateRequested = pyqtSignal()
-    exportRequested = pyqtSignal()
+    
+    # Tamaños compartidos por todos los botones
+    _BUTTON_MIN_SIZE = QSize(120, 80)
+    _ICON_SIZE = QSize(32, 32)
 
     def __init__(self, actions: Iterable[SidebarAction]) -> None:
         super().__init__()
+        # Un Iterable cualquiera se materializa una vez: se conoce N de antemano
+        actions = tuple(actions)
         self.setObjectName("sidebar")
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setMinimumWidth(140)
         
         self._layout = QVBoxLayout(self)
         self._layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self._group = QButtonGroup(self)
-        self._group.setExclusive(True)
-        self._buttons: dict[str, QToolButton] = {}
+        # Exclusividad manual (sin QButtonGroup): un solo toggled por clic
+        self._active: QToolButton | None = None
+        # Claves en el orden de los botones; los valores se rellenan en _build_buttons
+        self._buttons: dict[str, QToolButton] = dict.fromkeys(a.text for a in actions)
+        
+        # Construcción en bloque: sin repintados hasta el final
+        self.setUpdatesEnabled(False)
         
         # Header
         header = QLabel("ROBOT CORTADOR")
@@ -47,97 +92,106 @@ class Sidebar(QFrame):
         
         self._build_buttons(actions)
         
-        # Progress bar para simulación
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self._layout.addWidget(self.progress_bar)
+        # Progress bar para simulación: se crea en el primer uso (ver progress_bar)
+        self._progress_bar: QProgressBar | None = None
         
         self._layout.addStretch()
-        self._apply_style()
+        
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
+        
+        # La hoja se aplica en la siguiente vuelta del event loop: el pulido de
+        # todos los hijos sale del constructor. Mientras tanto, fondo por paleta
+        if not _global_qss_installed:
+            palette = self.palette()
+            palette.setColor(QPalette.ColorRole.Window, QColor("#1a1a1a"))
+            self.setPalette(palette)
+            self.setAutoFillBackground(True)
+            QTimer.singleShot(0, self._apply_style)
 
-    def _build_buttons(self, actions: Iterable[SidebarAction]) -> None:
+    def _apply_style(self) -> None:
+        self.setStyleSheet(_QSS)
+
+    @staticmethod
+    def install_global_stylesheet(app: QApplication) -> None:
+        """Install the sidebar QSS once on the application (call before creating sidebars)."""
+        global _global_qss_installed
+        if not _global_qss_installed:
+            app.setStyleSheet(app.styleSheet() + _QSS)
+            _global_qss_installed = True
+
+    def _build_buttons(self, actions: tuple[SidebarAction, ...]) -> None:
         for index, action in enumerate(actions):
             button = QToolButton()
             button.setText(action.text)
+            button.setProperty("action_name", action.text)
             button.setCheckable(True)
             button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-            button.setMinimumSize(120, 80)
+            button.setMinimumSize(self._BUTTON_MIN_SIZE)
             button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
             button.setEnabled(action.enabled)
             
-            if action.icon is not None:
+            if action.icon is not None and not action.icon.isNull():
                 button.setIcon(action.icon)
-                button.setIconSize(QSize(32, 32))
+                button.setIconSize(self._ICON_SIZE)
             
             self._layout.addWidget(button)
-            self._group.addButton(button)
             self._buttons[action.text] = button
-            button.toggled.connect(self._make_toggle_handler(action.text))
+            button.toggled[bool].connect(self._on_button_toggled, Qt.ConnectionType.DirectConnection)
             
             if index == 0:
                 button.setChecked(True)
 
-    def _apply_style(self) -> None:
-        self.setStyleSheet("""
-            #sidebar {
-                background-color: #1a1a1a;
-                color: #f0f0f0;
-                border-right: 1px solid #333;
-            }
-            #sidebar QToolButton {
-                border: 2px solid #245983;
-                padding: 8px 4px;
-                font-size: 11px;
-                background-color: transparent;
-                border-radius: 6px;
-                margin: 4px 6px;
-                font-weight: 500;
-                color: #d8dce2;
-            }
-            #sidebar QToolButton:checked {
-                background-color: #2f6ba5;
-                border-color: #5aa4db;
-                color: white;
-            }
-            #sidebar QToolButton:hover:!checked {
-                background-color: rgba(47,107,165,0.3);
-            }
-            #sidebar QToolButton:disabled {
-                border-color: #555;
-                color: #777;
-            }
-        """)
-
-    def _make_toggle_handler(self, name: str):
-        def handler(checked: bool) -> None:
-            if checked:
-                self.actionTriggered.emit(name)
-                # Emitir señales específicas
-                if name == "Cargar DXF":
-                    self.loadDxfRequested.emit()
-                elif name == "Generar Trayectoria":
-                    self.generatePathRequested.emit()
-                elif name == "Simular Corte":
-                    self.simulateRequested.emit()
-                elif name == "Exportar":
-                    self.exportRequested.emit()
-        return handler
+    @pyqtSlot(bool)
+    def _on_button_toggled(self, checked: bool) -> None:
+        """Slot único para todos los botones; el nombre viaja como propiedad."""
+        button = self.sender()
+        if not checked:
+            # Como en un grupo exclusivo, el botón activo no se desmarca con un clic
+            if button is self._active:
+                self._set_checked_silently(button, True)
+            return
+        if self._active is not None and self._active is not button:
+            self._set_checked_silently(self._active, False)
+        self._active = button
+        self.actionTriggered.emit(button.property("action_name"))
+
+    @staticmethod
+    def _set_checked_silently(button: QToolButton, checked: bool) -> None:
+        button.blockSignals(True)
+        button.setChecked(checked)
+        button.blockSignals(False)
 
     def trigger_action(self, name: str) -> None:
         """Programmatically activate a sidebar button."""
-        button = self._buttons.get(name)
-        if button is not None and button.isEnabled():
+        try:
+            button = self._buttons[name]
+        except KeyError:
+            return
+        if button.isEnabled():
             button.setChecked(True)
 
     def set_action_enabled(self, name: str, enabled: bool) -> None:
         """Habilitar/deshabilitar acción específica."""
-        button = self._buttons.get(name)
-        if button:
-            button.setEnabled(enabled)
+        try:
+            self._buttons[name].setEnabled(enabled)
+        except KeyError:
+            pass
+
+    @property
+    def progress_bar(self) -> QProgressBar:
+        """Barra de progreso, construida (oculta) al pedirla por primera vez."""
+        if self._progress_bar is None:
+            self._progress_bar = QProgressBar(self)
+            self._progress_bar.setVisible(False)
+            # Antes del stretch final, como si se hubiera añadido en __init__
+            self._layout.insertWidget(self._layout.count() - 1, self._progress_bar)
+        return self._progress_bar
 
     def show_progress(self, visible: bool) -> None:
         """Mostrar/ocultar barra de progreso."""
-        self.progress_bar.setVisible(visible)
+        if visible or self._progress_bar is not None:
+            self.progress_bar.setVisible(visible)
 
     def set_progress(self, value: int) -> None:
         """Establecer valor de progreso."""
@@ -1,10 +1,28 @@
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QPixmap, QPainter
+from PyQt6.QtCore import Qt, pyqtSlot
 
 from app.ui.parts.sidebar import Sidebar, SidebarAction
 
+# QIcon("📁") trata el emoji como ruta de archivo y Qt lo busca en disco en
+# cada pintado; se rasteriza una vez a un QPixmap y se reutiliza
+_ICONS: dict[str, QIcon] = {}
+
+
+def emoji_icon(emoji: str) -> QIcon:
+    """Icono a partir de un emoji (requiere QApplication creada)"""
+    icon = _ICONS.get(emoji)
+    if icon is None:
+        pm = QPixmap(32, 32)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.drawText(pm.rect(), Qt.AlignmentFlag.AlignCenter, emoji)
+        p.end()
+        icon = _ICONS[emoji] = QIcon(pm)
+    return icon
+
+
 class TestWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -13,16 +31,16 @@ class TestWindow(QMainWindow):
         
         # Crear acciones de prueba
         actions = [
-            SidebarAction("Archivo", QIcon("📁")),  # Puedes usar emojis como iconos simples
-            SidebarAction("Editar", QIcon("✏️")),
-            SidebarAction("Ver", QIcon("👁️")),
-            SidebarAction("Herramientas", QIcon("🔧")),
-            SidebarAction("Ayuda", QIcon("❓")),
+            SidebarAction("Archivo", emoji_icon("📁")),  # Puedes usar emojis como iconos simples
+            SidebarAction("Editar", emoji_icon("✏️")),
+            SidebarAction("Ver", emoji_icon("👁️")),
+            SidebarAction("Herramientas", emoji_icon("🔧")),
+            SidebarAction("Ayuda", emoji_icon("❓")),
         ]
         
         # Crear sidebar
         self.sidebar = Sidebar(actions)
-        self.sidebar.actionTriggered.connect(self.on_action_triggered)
+        self.sidebar.actionTriggered.connect(self.on_action_triggered, Qt.ConnectionType.DirectConnection)
         
         # Área de contenido
         self.content_label = QLabel("Selecciona una acción del sidebar")
@@ -47,6 +65,7 @@ class TestWindow(QMainWindow):
         sidebar_layout.addWidget(self.sidebar)
         self.setMenuWidget(sidebar_container)
     
+    @pyqtSlot(str)
     def on_action_triggered(self, action_name: str):
         self.content_label.setText(f"Acción seleccionada: {action_name}")
         print(f"Sidebar action: {action_name}")